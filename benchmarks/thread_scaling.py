@@ -0,0 +1,91 @@
+"""
+Parse N independent configurations on 1..K threads and report the speedup over a single thread.
+
+Every configuration is parsed by its own ConfigParser, the way a server handling many tenants would.
+On a regular (GIL) build the speedup stays around 1, on a free-threaded build (e.g. python3.13t) it
+should grow with the number of threads up to the number of cores. --reader fast selects the fast
+reader, which is used up to Python 3.12 (later versions fall back to the standard library reader).
+
+    python benchmarks/thread_scaling.py --configs 64 --sections 200 --max-threads 8
+"""
+
+import argparse
+import concurrent.futures
+import dataclasses
+import functools
+import os
+import sys
+import time
+import typing
+
+from typed_configparser import ConfigParser
+
+
+@dataclasses.dataclass(frozen=True)
+class Service:
+    host: str
+    port: int
+    timeout: float
+    enabled: bool
+    tags: typing.List[str]
+    limits: typing.Dict[str, int]
+    owner: typing.Optional[str] = None
+
+
+def make_config(number: int, sections: int) -> str:
+    return "".join(
+        f"[service:{number}-{i}]\n"
+        f"host = host-{i}.example.com\n"
+        f"port = {8000 + i % 1000}\n"
+        f"timeout = {i % 30}.5\n"
+        f"enabled = {'yes' if i % 2 else 'no'}\n"
+        f"tags = [tier{i % 3}, zone{i % 5}]\n"
+        f"limits = {{cpu: {i % 8 + 1}, memory: {256 * (i % 4 + 1)}}}\n"
+        for i in range(sections)
+    )
+
+
+def parse_config(text: str, reader: typing.Literal["stdlib", "fast"]) -> int:
+    parser = ConfigParser(reader=reader)
+    parser.read_string(text)
+    return len(parser.parse_matching("service:*", Service))
+
+
+def run(configs: typing.List[str], threads: int, reader: typing.Literal["stdlib", "fast"]) -> float:
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        parsed = sum(executor.map(functools.partial(parse_config, reader=reader), configs))
+    elapsed = time.perf_counter() - start
+    assert parsed == sum(text.count("[service:") for text in configs)
+    return elapsed
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--configs", type=int, default=64, help="Number of configurations to parse")
+    arg_parser.add_argument("--sections", type=int, default=200, help="Sections per configuration")
+    arg_parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1, help="Largest number of threads")
+    arg_parser.add_argument(
+        "--reader", choices=["stdlib", "fast"], default="stdlib", help="Reader engine of the parsers, see ConfigParser"
+    )
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs per thread count, the best is kept")
+    args = arg_parser.parse_args(argv)
+
+    configs = [make_config(n, args.sections) for n in range(args.configs)]
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if is_gil_enabled() else 'disabled'}, {os.cpu_count()} cores")
+    print(f"{args.configs} configurations of {args.sections} sections, {args.reader} reader\n")
+
+    # Warm up the caches shared by all parsers (type hints, construction plans)
+    parse_config(configs[0], args.reader)
+    print(f"{'threads':>7}  {'seconds':>8}  {'sections/s':>11}  {'speedup':>7}")
+    baseline = None
+    for threads in range(1, args.max_threads + 1):
+        elapsed = min(run(configs, threads, args.reader) for _ in range(args.repeat))
+        baseline = baseline or elapsed
+        rate = args.configs * args.sections / elapsed
+        print(f"{threads:>7}  {elapsed:>8.3f}  {rate:>11,.0f}  {baseline / elapsed:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
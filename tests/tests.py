@@ -1,14 +1,58 @@
+import bz2
+import configparser
+from configparser import NoSectionError
+import contextlib
 import dataclasses
+import datetime
+import decimal
+import enum
+import gzip
+import io
+import json
+import lzma
+import os
 from pathlib import Path, PosixPath
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
 import typing
 import unittest
 
+import typing_extensions
+
+from typed_configparser import cli
+from typed_configparser.constraints import Choices, Length, Pattern, Range
+from typed_configparser.diff import ConfigDiff, SectionDiff
 from typed_configparser.exceptions import ParseError
-from typed_configparser.parser import ConfigParser
+from typed_configparser.generations import ConfigHolder
+from typed_configparser.memory import FieldMemory, MemoryProfiler
+from typed_configparser.parser import ConfigParser, enum_converter, literal_converter
+from typed_configparser.reader import supports_fast_read
+from typed_configparser.store import ConfigStore, StoreStats
 
 _SECTION_ = "test_section"
 
 
+@dataclasses.dataclass
+class CliDataclass:
+    option1: int
+    option2: typing.List[str]
+
+
+@dataclasses.dataclass
+class StringAnnotationsDataclass:
+    # As written with `from __future__ import annotations`
+    option1: "int"
+    option2: "dataclasses.InitVar[typing.Optional[str]]" = None
+    option3: "typing.Optional[str]" = None
+
+    def __post_init__(self, option2: typing.Optional[str]) -> None:
+        self.option3 = option2
+
+
 class TestConfigParser(unittest.TestCase):
     def setUp(self) -> None:
         self.config_parser = ConfigParser()
@@ -79,6 +123,11 @@ class TestConfigParser(unittest.TestCase):
         self.assertEqual(result.option1, 42)
         self.assertEqual(result.option2, "value")
         self.assertEqual(getattr(result, "extra_option", None), "extra_value")
+        self.assertEqual(str(result), "TestDataclass(option1=42, option2=value, extra_option=extra_value)")
+        # Extra fields belong to the instance, the dataclass is unchanged
+        self.assertEqual([f.name for f in dataclasses.fields(TestDataclass)], ["option1", "option2"])
+        self.assertFalse(hasattr(TestDataclass, "__dataclass_extra_fields__"))
+        self.assertEqual(str(TestDataclass(1, "foo")), "TestDataclass(option1=1, option2=foo)")
 
     def test_parse_section_extra_fields_error(self) -> None:
         @dataclasses.dataclass
@@ -112,6 +161,29 @@ class TestConfigParser(unittest.TestCase):
         self.assertEqual(result.option2, "value")
         self.assertFalse(hasattr(result, "extra_option"))
 
+    def test_parse_section_extra_fields_frozen_or_slotted(self) -> None:
+        @dataclasses.dataclass(frozen=True)
+        class FrozenDataclass:
+            option1: int
+
+        @dataclasses.dataclass
+        class SlottedDataclass:
+            __slots__ = ("option1",)
+            option1: int
+
+        self.config_parser.add_section(_SECTION_)
+        self.config_parser.set(_SECTION_, "option1", "42")
+        self.config_parser.set(_SECTION_, "extra_option", "extra_value")
+
+        using_dataclass: typing.Any
+        for using_dataclass in (FrozenDataclass, SlottedDataclass):
+            with self.assertRaisesRegex(
+                ParseError, f"Extra fields extra_option can't be stored .* '{using_dataclass.__name__}'"
+            ):
+                self.config_parser.parse_section(using_dataclass, _SECTION_)
+            result = self.config_parser.parse_section(using_dataclass, _SECTION_, extra="ignore")
+            self.assertEqual(result.option1, 42)
+
     def test_parse_section_list_fields(self) -> None:
         @dataclasses.dataclass
         class TestDataclass:
@@ -386,6 +458,22 @@ class TestConfigParser(unittest.TestCase):
         self.assertEqual(result.option1, 10)
         self.assertFalse(hasattr(result, "option2"))
 
+    def test_parse_section_field_level_init_flag_option_set(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: int
+            option2: int = dataclasses.field(init=False, default=3)
+
+        self.config_parser.add_section(_SECTION_)
+        self.config_parser.set(_SECTION_, "option1", "10")
+        self.config_parser.set(_SECTION_, "option2", "5")
+        result = self.config_parser.parse_section(TestDataclass, _SECTION_, extra="error")
+
+        self.assertEqual((result.option1, result.option2), (10, 3))
+        self.assertFalse(hasattr(result, "__dataclass_extra_fields__"))
+        records = self.config_parser.parse_records(_SECTION_, TestDataclass)
+        self.assertEqual(records.rows, [(10,)])
+
     def test_parse_section_post_init_method(self) -> None:
         @dataclasses.dataclass
         class TestDataclass:
@@ -424,6 +512,944 @@ class TestConfigParser(unittest.TestCase):
         self.assertEqual(result.option1, 10)
         self.assertEqual(result.option3, "foo")
 
+    def test_parse_section_string_annotations(self) -> None:
+        self.config_parser.read_string(f"[{_SECTION_}]\noption1 = 10\n")
+
+        result = self.config_parser.parse_section(StringAnnotationsDataclass, _SECTION_, init_vars={"option2": "foo"})
+
+        self.assertEqual(result, StringAnnotationsDataclass(10, "foo"))
+        self.assertEqual(result.option3, "foo")
+
+    @unittest.skipIf(sys.version_info < (3, 10), "kw_only requires Python 3.10")
+    def test_parse_section_keyword_only_fields(self) -> None:
+        @dataclasses.dataclass(**{"kw_only": True})
+        class BaseDataclass:
+            option1: int
+            option2: typing.Optional[str]
+
+        @dataclasses.dataclass
+        class TestDataclass(BaseDataclass):
+            option3: dataclasses.InitVar[typing.Optional[int]]
+            option4: float
+            option5: int = 5
+
+            def __post_init__(self, option3: typing.Optional[int]) -> None:
+                self.option5 += option3 or 0
+
+        self.config_parser.add_section(_SECTION_)
+        self.config_parser.set(_SECTION_, "option4", "1.5")
+        with self.assertRaisesRegex(ParseError, "for option 'option1': Unable to find value"):
+            self.config_parser.parse_section(TestDataclass, _SECTION_)
+
+        self.config_parser.set(_SECTION_, "option1", "10")
+        result = self.config_parser.parse_section(TestDataclass, _SECTION_, init_vars={"option3": 2})
+        self.assertEqual((result.option1, result.option2, result.option4, result.option5), (10, None, 1.5, 7))
+
+    def test_write_section_round_trip(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: int
+            option2: str
+            option3: float
+            option4: bool
+            option5: typing.List[typing.Tuple[str, int]]
+            option6: typing.Dict[str, typing.Union[int, bool]]
+            option7: typing.Optional[int] = None
+            option8: typing.Optional[str] = None
+
+        instance = TestDataclass(42, "multi\nline", 0.1, False, [("foo", 1), ("bar", 2)], {"key1": 10, "key2": True}, 7)
+        self.config_parser.write_section(instance, _SECTION_)
+
+        self.assertEqual(self.config_parser.get(_SECTION_, "option4"), "false")
+        self.assertEqual(self.config_parser.get(_SECTION_, "option5"), "[(foo, 1), (bar, 2)]")
+        self.assertEqual(self.config_parser.get(_SECTION_, "option6"), "{key1: 10, key2: true}")
+
+        result = self.config_parser.parse_section(TestDataclass, _SECTION_)
+        self.assertEqual(result, instance)
+
+    def test_write_section_omits_optional_none(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: typing.Optional[str]
+            option2: float = dataclasses.field(init=False, default=0.0)
+
+        self.config_parser.write_section(TestDataclass(None))
+
+        self.assertEqual(self.config_parser.options("TestDataclass"), [])
+        self.assertEqual(self.config_parser.parse_section(TestDataclass).option1, None)
+
+    def test_dump_all(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: int
+            option2: typing.List[str]
+
+        fp = io.StringIO()
+        self.config_parser.dump_all({"first": TestDataclass(1, ["foo"]), "second": TestDataclass(2, ["bar", "baz"])}, fp)
+
+        self.assertEqual(
+            fp.getvalue(),
+            "[first]\noption1 = 1\noption2 = [foo]\n\n[second]\noption1 = 2\noption2 = [bar, baz]\n\n",
+        )
+        self.config_parser.read_string(fp.getvalue())
+        self.assertEqual(self.config_parser.parse_section(TestDataclass, "second"), TestDataclass(2, ["bar", "baz"]))
+
+    def test_write_interpolation_syntax(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: str
+            option2: typing.List[str]
+
+        instance = TestDataclass("50%", ["$x", "100%"])
+        for interpolation in [configparser.BasicInterpolation(), configparser.ExtendedInterpolation(), None]:
+            config_parser = ConfigParser(interpolation=interpolation)
+            config_parser.write_section(instance, "written")
+            fp = io.StringIO()
+            config_parser.dump_all({"dumped": instance}, fp)
+            config_parser.read_string(fp.getvalue())
+
+            self.assertEqual(config_parser.parse_section(TestDataclass, "written"), instance)
+            self.assertEqual(config_parser.parse_section(TestDataclass, "dumped"), instance)
+
+    def test_write_empty_containers(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: typing.List[str]
+            option2: typing.List[int]
+            option3: typing.Tuple[int, ...]
+            option4: typing.Dict[str, int]
+
+        instance = TestDataclass([], [], (), {})
+        self.config_parser.write_section(instance, "written")
+        fp = io.StringIO()
+        self.config_parser.dump_all({"dumped": instance}, fp)
+        self.config_parser.read_string(fp.getvalue())
+
+        self.assertEqual(self.config_parser.get("written", "option4"), "{}")
+        self.assertEqual(self.config_parser.parse_section(TestDataclass, "written"), instance)
+        self.assertEqual(self.config_parser.parse_section(TestDataclass, "dumped"), instance)
+
+    def test_write_value_not_read_back(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: typing.List[str] = dataclasses.field(default_factory=list)
+            option2: str = ""
+
+        for instance in [
+            TestDataclass(["a, b"]),
+            TestDataclass(["[x]", "y"]),
+            TestDataclass(option2="[x]"),
+            TestDataclass(option2=" pad "),
+            TestDataclass(option2="multi\n  indented"),
+        ]:
+            option = "option1" if instance.option1 else "option2"
+            with self.assertRaisesRegex(ParseError, f"option '{option}': Value .* would not be read back unchanged"):
+                self.config_parser.write_section(instance, _SECTION_)
+            with self.assertRaisesRegex(ParseError, f"option '{option}': Value .* would not be read back unchanged"):
+                self.config_parser.dump_all({_SECTION_: instance}, io.StringIO())
+
+        self.assertFalse(self.config_parser.has_section(_SECTION_))
+
+    def test_dump_all_invalid_dataclass(self) -> None:
+        with self.assertRaisesRegex(ParseError, "ParseError in section 'int'"):
+            self.config_parser.dump_all([10], io.StringIO())  # type: ignore
+
+    def test_get_typed(self) -> None:
+        self.config_parser.add_section(_SECTION_)
+        self.config_parser.set(_SECTION_, "option1", "[10, 20]")
+        self.config_parser.set(_SECTION_, "option2", "foo")
+
+        self.assertEqual(self.config_parser.get_typed(_SECTION_, "option1", typing.List[int]), [10, 20])
+        self.assertEqual(self.config_parser.get_typed(_SECTION_, "option3", int, fallback=5), 5)
+        with self.assertRaisesRegex(
+            ParseError, f"ParseError in section '{_SECTION_}' for option 'option2': Cannot cast value 'foo' to 'int'"
+        ):
+            self.config_parser.get_typed(_SECTION_, "option2", int)
+
+    def test_typed_section(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: int
+            option2: typing.List[str]
+
+        self.config_parser.add_section(_SECTION_)
+        self.config_parser.set(_SECTION_, "option1", "10")
+        self.config_parser.set(_SECTION_, "option2", "[foo, bar]")
+        self.config_parser.set(_SECTION_, "extra_option", "extra_value")
+
+        section = self.config_parser.typed_section(TestDataclass, _SECTION_)
+
+        self.assertEqual(section["option1"], 10)
+        self.assertIs(section["option2"], section["option2"])
+        self.assertEqual(section["extra_option"], "extra_value")
+        self.assertEqual(dict(section), {"option1": 10, "option2": ["foo", "bar"], "extra_option": "extra_value"})
+        with self.assertRaises(KeyError):
+            section["option3"]
+
+        self.config_parser.set(_SECTION_, "option1", "20")
+        self.config_parser.read_string(f"[{_SECTION_}]\noption2 = [baz]\n")
+        self.assertEqual(section["option1"], 20)
+        self.assertEqual(section["option2"], ["baz"])
+
+    def test_typed_section_missing(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: int
+
+        with self.assertRaises(NoSectionError):
+            self.config_parser.typed_section(TestDataclass, _SECTION_)
+
+    def test_parse_section_intern_values(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: str
+            option2: typing.Tuple[str, int]
+            option3: typing.List[str]
+            option4: typing.Tuple[bool, int]
+
+        config_parser = ConfigParser(intern_values=True)
+        config_parser.read_string(
+            "[DEFAULT]\noption4 = (true, 1)\n"
+            "[first]\noption1 = zone-a\noption2 = (foo, 1)\noption3 = [foo, zone-a]\n"
+            "[second]\noption1 = zone-a\noption2 = (foo, 1)\noption3 = [zone-a]\n"
+        )
+
+        first = config_parser.parse_section(TestDataclass, "first")
+        second = config_parser.parse_section(TestDataclass, "second")
+
+        self.assertIs(first.option1, second.option1)
+        self.assertIs(first.option2, second.option2)
+        self.assertIsNot(first.option3, second.option3)
+        self.assertIs(first.option3[1], second.option3[0])
+        self.assertEqual(second.option4, (True, 1))
+        self.assertIsInstance(second.option4[0], bool)
+        report = config_parser.intern_pool.report()  # type: ignore[union-attr]
+        self.assertGreater(report.hits, 0)
+        self.assertGreater(report.bytes_saved, 0)
+        self.assertIsNone(self.config_parser.intern_pool)
+
+    def test_parse_matching(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: int
+
+        self.config_parser.read_string("[service:b]\noption1 = 2\n[service:a]\noption1 = 1\n[services]\noption1 = 3\n")
+        self.assertEqual(self.config_parser.sections_matching("service:*"), ["service:a", "service:b"])
+        self.config_parser.add_section("service:c")
+        self.config_parser.set("service:c", "option1", "4")
+        self.config_parser.remove_section("service:b")
+
+        result = self.config_parser.parse_matching("service:*", TestDataclass)
+
+        self.assertEqual(result, {"service:a": TestDataclass(1), "service:c": TestDataclass(4)})
+        # Converters are cached per type, not per section and option
+        self.assertEqual(list(getattr(self.config_parser, "_typed_converters")), [int])
+        self.assertEqual(self.config_parser.sections_matching("service?"), ["services"])
+        self.assertEqual(self.config_parser.sections_matching("services"), ["services"])
+        self.assertEqual(self.config_parser.sections_matching("*:[ab]"), ["service:a"])
+        self.assertEqual(self.config_parser.sections_matching("DEFAULT"), [])
+
+    def test_parse_section_threads(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: int
+            option2: typing.List[str]
+
+        def parse(n: int) -> typing.Dict[str, TestDataclass]:
+            config_parser = ConfigParser()
+            config_parser.read_string(
+                "".join(f"[service:{i}]\noption1 = {n}\noption2 = [a, b]\nextra{n} = {i}\n" for i in range(50))
+            )
+            return config_parser.parse_matching("service:*", TestDataclass)
+
+        results: typing.Dict[int, typing.Dict[str, TestDataclass]] = {}
+        threads = [threading.Thread(target=lambda n=n: results.__setitem__(n, parse(n))) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for n, sections in results.items():
+            self.assertEqual(len(sections), 50)
+            for i, (name, section) in enumerate(sorted(sections.items(), key=lambda item: int(item[0][8:]))):
+                self.assertEqual((section.option1, section.option2), (n, ["a", "b"]))
+                self.assertEqual(getattr(section, "__dataclass_extra_fields__"), (f"extra{n}",))
+                self.assertEqual(getattr(section, f"extra{n}"), str(i))
+        self.assertEqual(len(results), 8)
+        self.assertEqual(len(dataclasses.fields(TestDataclass)), 2)
+
+    def test_parse_section_namedtuple(self) -> None:
+        class TestNamedTuple(typing.NamedTuple):
+            option1: int
+            option2: typing.Optional[typing.List[str]]
+            option3: typing_extensions.Annotated[float, Range(max=10)] = 1.5
+
+        self.config_parser.read_string(
+            "[first]\noption1 = 1\noption2 = [a, b]\nextra = x\n[second]\noption1 = 2\noption3 = 3\n[third]\n"
+        )
+
+        self.assertEqual(self.config_parser.parse_section(TestNamedTuple, "first"), TestNamedTuple(1, ["a", "b"], 1.5))
+        self.assertEqual(self.config_parser.parse_section(TestNamedTuple, "second"), TestNamedTuple(2, None, 3.0))
+        with self.assertRaisesRegex(ParseError, "Extra fields are not allowed"):
+            self.config_parser.parse_section(TestNamedTuple, "first", extra="error")
+        with self.assertRaisesRegex(ParseError, "for option 'option1': Unable to find value"):
+            self.config_parser.parse_section(TestNamedTuple, "third")
+
+    def test_parse_records(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: int
+            option2: typing.Optional[str]
+            option3: typing.List[int] = dataclasses.field(default_factory=list)
+            option4: bool = False
+            option5: int = dataclasses.field(init=False, default=0)
+
+        class TestNamedTuple(typing.NamedTuple):
+            option1: int
+            option4: bool = False
+
+        self.config_parser.read_string(
+            "[row:2]\noption1 = 2\noption3 = [1, 2]\nextra = x\n[row:1]\noption1 = 1\noption2 = b\noption4 = yes\n"
+        )
+
+        records = self.config_parser.parse_records("row:*", TestDataclass)
+        self.assertEqual(dict(records.fields), {"option1": 0, "option2": 1, "option3": 2, "option4": 3})
+        self.assertEqual(records.sections, ["row:1", "row:2"])
+        self.assertEqual(records.rows, [(1, "b", [], True), (2, None, [1, 2], False)])
+        self.assertEqual(records.column("option1"), [1, 2])
+        self.assertEqual(len(records), 2)
+
+        records = self.config_parser.parse_records("row:*", TestNamedTuple)
+        self.assertEqual(records.rows, [TestNamedTuple(1, True), TestNamedTuple(2, False)])
+        with self.assertRaisesRegex(ParseError, "Extra fields are not allowed"):
+            self.config_parser.parse_records("row:*", TestNamedTuple, extra="error")
+
+    def test_parse_section_builtin_converters(self) -> None:
+        class Color(enum.Enum):
+            RED = "red"
+            GREEN = "green"
+
+        class Level(enum.IntEnum):
+            LOW = 1
+            HIGH = 2
+
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: datetime.datetime
+            option2: typing.List[datetime.date]
+            option3: datetime.time
+            option4: typing.Dict[str, datetime.timedelta]
+            option5: decimal.Decimal
+            option6: Path
+            option7: typing.List[Color]
+            option8: typing.Optional[Level]
+            option9: typing.Literal["debug", "info", 3, True]
+            option10: typing.Tuple[typing.Literal["a", None], typing.Union[Color, int]]
+
+        self.config_parser.add_section(_SECTION_)
+        self.config_parser.set(_SECTION_, "option1", "2024-05-01T10:30:00")
+        self.config_parser.set(_SECTION_, "option2", "[2024-05-01, 2024-05-02]")
+        self.config_parser.set(_SECTION_, "option3", "10:30")
+        self.config_parser.set(_SECTION_, "option4", "{short: 500ms, long: 1h30m, clock: 1:00:05}")
+        self.config_parser.set(_SECTION_, "option5", "0.1")
+        self.config_parser.set(_SECTION_, "option6", "/tmp/file")
+        self.config_parser.set(_SECTION_, "option7", "[red, GREEN]")
+        self.config_parser.set(_SECTION_, "option8", "2")
+        self.config_parser.set(_SECTION_, "option9", "3")
+        self.config_parser.set(_SECTION_, "option10", "(NULL, 5)")
+
+        result = self.config_parser.parse_section(TestDataclass, _SECTION_)
+
+        self.assertEqual(result.option1, datetime.datetime(2024, 5, 1, 10, 30))
+        self.assertEqual(result.option2, [datetime.date(2024, 5, 1), datetime.date(2024, 5, 2)])
+        self.assertEqual(result.option3, datetime.time(10, 30))
+        self.assertEqual(
+            result.option4,
+            {
+                "short": datetime.timedelta(milliseconds=500),
+                "long": datetime.timedelta(hours=1, minutes=30),
+                "clock": datetime.timedelta(hours=1, seconds=5),
+            },
+        )
+        self.assertEqual(result.option5, decimal.Decimal("0.1"))
+        self.assertEqual(result.option6, Path("/tmp/file"))
+        self.assertEqual(result.option7, [Color.RED, Color.GREEN])
+        self.assertIs(result.option8, Level.HIGH)
+        self.assertEqual(result.option9, 3)
+        self.assertEqual(result.option10, (None, 5))
+
+        config_parser = ConfigParser()
+        config_parser.write_section(result, "copy")
+        self.assertEqual(config_parser.get("copy", "option4"), "{short: 0.5s, long: 1h30m, clock: 1h5s}")
+        self.assertEqual(config_parser.get("copy", "option7"), "[RED, GREEN]")
+        self.assertEqual(config_parser.parse_section(TestDataclass, "copy"), result)
+
+        for option, value, message in [
+            ("option1", "yesterday", "Cannot cast value 'yesterday' to 'datetime'"),
+            ("option4", "{a: 1h 2h}", "Cannot cast value '1h 2h' to 'timedelta'"),
+            ("option5", "ten", "Cannot cast value 'ten' to 'Decimal'"),
+            ("option7", "[red, Red]", "Cannot cast value 'Red' to 'Color'"),
+            ("option9", "warning", "Cannot cast value 'warning' to 'Literal\\['debug', 'info', 3, True\\]'"),
+        ]:
+            config_parser.set("copy", option, value)
+            with self.assertRaisesRegex(ParseError, f"for option '{option}': {message}"):
+                config_parser.parse_section(TestDataclass, "copy")
+            config_parser.write_section(result, "copy")
+
+        self.config_parser.set(_SECTION_, "option9", "INFO")
+        self.config_parser.set(_SECTION_, "option7", "[Red]")
+        self.config_parser.register_converter(Color, enum_converter(Color, case_sensitive=False))
+        self.config_parser.type_converters.register_generic(typing.Literal, literal_converter(case_sensitive=False))
+        result = self.config_parser.parse_section(TestDataclass, _SECTION_)
+        self.assertEqual((result.option7, result.option9), ([Color.RED], "info"))
+
+    @unittest.skipIf(sys.version_info < (3, 9, 1), "typing caches Literal[1] and Literal[True] as the same type")
+    def test_parse_section_literal_equal_args(self) -> None:
+        @dataclasses.dataclass
+        class IntDataclass:
+            x: typing.Literal[1]
+
+        @dataclasses.dataclass
+        class BoolDataclass:
+            y: typing.Literal[True]
+
+        self.config_parser.read_string(f"[{_SECTION_}]\nx = 1\ny = true\n")
+        self.assertIs(self.config_parser.parse_section(IntDataclass, _SECTION_).x, 1)
+        self.assertIs(self.config_parser.parse_section(BoolDataclass, _SECTION_).y, True)
+
+        config_parser = ConfigParser()
+        config_parser.read_string(f"[{_SECTION_}]\ny = 1\n")
+        self.assertIs(config_parser.parse_section(BoolDataclass, _SECTION_).y, True)
+        self.assertIsNot(
+            config_parser.type_converters.lookup_generic(typing.Literal),
+            self.config_parser.type_converters.lookup_generic(typing.Literal),
+        )
+
+    def test_register_converter(self) -> None:
+        class ByteSize(int):
+            pass
+
+        class SmallByteSize(ByteSize):
+            pass
+
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: ByteSize
+            option2: typing.List[typing.Optional[SmallByteSize]]
+            option3: typing.Set[int]
+
+        units = {"k": 1024, "m": 1024 * 1024}
+        self.config_parser.register_converter(ByteSize, lambda value: ByteSize(int(value[:-1]) * units[value[-1]]))
+        self.config_parser.register_generic_converter(
+            set, lambda value, args, cast: {cast(item.strip(), args[0]) for item in value.split(",")}
+        )
+        self.config_parser.add_section(_SECTION_)
+        self.config_parser.set(_SECTION_, "option1", "2k")
+        self.config_parser.set(_SECTION_, "option2", "[1m, none]")
+        self.config_parser.set(_SECTION_, "option3", "1, 2, 1")
+
+        result = self.config_parser.parse_section(TestDataclass, _SECTION_)
+
+        self.assertEqual(result.option1, 2048)
+        self.assertEqual(result.option2, [1024 * 1024, None])
+        self.assertEqual(result.option3, {1, 2})
+
+        self.config_parser.set(_SECTION_, "option1", "2x")
+        with self.assertRaisesRegex(
+            ParseError, f"ParseError in section '{_SECTION_}' for option 'option1': Cannot cast value '2x' to 'ByteSize'"
+        ):
+            self.config_parser.parse_section(TestDataclass, _SECTION_)
+
+        # Converters are registered per instance
+        self.assertIsNone(ConfigParser().type_converters.lookup(ByteSize))
+
+    def test_read_compressed(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: int
+            option2: typing.List[str]
+
+        content = "[{}]\noption1 = {}\noption2 = [caf\u00e9,\n  b]\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [Path(tmp, "plain.ini"), Path(tmp, "a.ini.gz"), Path(tmp, "b.ini.bz2"), Path(tmp, "c.xz")]
+            paths[0].write_text(content.format("plain", 0), encoding="utf-8")
+            for i, module in enumerate((gzip, bz2, lzma), start=1):
+                with module.open(paths[i], "wt", encoding="utf-8") as fp:
+                    fp.write(content.format(paths[i].suffix, i))
+
+            for reader in ("stdlib", "fast"):
+                config_parser = ConfigParser(reader=reader)
+                read_ok = config_parser.read([*paths, Path(tmp, "missing.ini")], encoding="utf-8")
+
+                self.assertEqual(read_ok, [str(path) for path in paths])
+                self.assertEqual(config_parser.sections(), ["plain", ".gz", ".bz2", ".xz"])
+                for i, section in enumerate(config_parser.sections()):
+                    result = config_parser.parse_section(TestDataclass, section)
+                    self.assertEqual(result, TestDataclass(i, ["caf\u00e9", "b"]))
+
+            self.assertEqual(ConfigParser().read(str(paths[1]), encoding="utf-8"), [str(paths[1])])
+
+    @unittest.skipUnless(os.path.isdir("/dev/fd"), "Pipes can't be opened by path")
+    def test_read_pipe(self) -> None:
+        content = "[{}]\noption1 = 1\n"
+        for data in (content.format("plain").encode(), gzip.compress(content.format("gzip").encode())):
+            # A pipe can only be read once, as with process substitution: app --config <(command)
+            read_fd, write_fd = os.pipe()
+            try:
+                os.write(write_fd, data)
+                os.close(write_fd)
+                config_parser = ConfigParser()
+                read_ok = config_parser.read(f"/dev/fd/{read_fd}")
+            finally:
+                os.close(read_fd)
+
+            self.assertEqual(read_ok, [f"/dev/fd/{read_fd}"])
+            self.assertEqual(config_parser.getint(config_parser.sections()[0], "option1"), 1)
+
+    def test_read_corrupt_compressed(self) -> None:
+        content = ("[a]\n" + "".join(f"option{i} = {i}\n" for i in range(20000))).encode()
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for module in (gzip, bz2, lzma):
+                compressed = module.compress(content)
+                paths.append(Path(tmp, f"truncated.{module.__name__}"))
+                paths[-1].write_bytes(compressed[: len(compressed) // 2])
+            paths.append(Path(tmp, "garbage.gz"))
+            paths[-1].write_bytes(b"\x1f\x8b" + b"\x00" * 100)
+
+            for path in paths:
+                for reader in ("stdlib", "fast"):
+                    config_parser = ConfigParser(reader=reader)
+                    with self.assertRaisesRegex(configparser.ParsingError, re.escape(str(path)), msg=str(path)):
+                        config_parser.read([Path(tmp, "missing.ini"), path])
+
+
+_READER_CONFIGS_: typing.List[typing.Dict[str, typing.Any]] = [
+    {},
+    {"allow_no_value": True},
+    {"delimiters": ("=>", "=", ":")},
+    {"comment_prefixes": ("//", "#"), "inline_comment_prefixes": ("#", ";")},
+    {"strict": False},
+    {"empty_lines_in_values": False},
+    {"default_section": "common", "allow_no_value": True, "inline_comment_prefixes": (";",)},
+]
+
+_READER_INPUTS_ = [
+    "[a]\nx = 1\ny: 2\nz=3=4\nw :=5\n",
+    "[DEFAULT]\nd = 1\n[a]\nx = %(d)s\n[common]\nc = 1\n",
+    "[a]\nx = first\n  second\n\n  third\n\ty = tab\nz = 1\n",
+    "[a]\nx = 1\n\n\n[b]\ny = [1,\n  2]\n",
+    "# comment\n; other\n[a] ; header comment\nx = 1 # inline\ny = 2;not inline\n  # indented comment\nz = 3\n",
+    "[a]\nx = 1 // c\n// full\n",
+    "[ spaced ]\nx = 1\n[a]] trailing\ny = 2\n[]\n[b]x\n",
+    "[a]\nx\ny = 1\n= nooption\n  = cont\n",
+    "[a]\nx = 1\n[a]\ny = 2\n",
+    "[a]\nx = 1\nX = 2\n",
+    "x = 1\n[a]\n",
+    "\n\n   \n[a]\r\nx = 1\r\n  y\r\n",
+    "[a]\n\u00a0x\u00a0=\u00a0v\u00a0\n\u3000[b]\n",
+    "[a]\nkey => value = other\nk2 =>\nk3 ==> v\n",
+    "[common]\nx = 1\n[a]\nx = 2\n[common]\ny = 3\n",
+    "[a]\nx =\n  \n  y\n#c\n  z\n",
+    "[a]] trailing\nx = 1\n[b] c]\ny = 2\n",
+]
+
+
+class TestConstraints(unittest.TestCase):
+    def setUp(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: typing_extensions.Annotated[int, Range(min=1, max=10)]
+            option2: typing_extensions.Annotated[str, Pattern(r"[a-z]+"), Length(max=5)]
+            option3: typing.List[typing_extensions.Annotated[str, Choices("a", "b")]]
+            option4: typing_extensions.Annotated[typing.Optional[float], Range(min=0.5), "unrelated metadata"] = None
+            option5: typing_extensions.Annotated[typing.Optional[int], Length(max=2)] = None
+            option6: typing.List[typing_extensions.Annotated[int, {"doc": "unhashable metadata"}, Range(max=3)]] = (
+                dataclasses.field(default_factory=list)
+            )
+
+        self.dataclass = TestDataclass
+        self.config_parser = ConfigParser()
+        self.config_parser.read_string(f"[{_SECTION_}]\noption1 = 5\noption2 = foo\noption3 = [a, b]\n")
+
+    def test_valid(self) -> None:
+        result = self.config_parser.parse_section(self.dataclass, _SECTION_)
+
+        self.assertEqual((result.option1, result.option2, result.option3, result.option4), (5, "foo", ["a", "b"], None))
+
+    def test_none_and_metadata(self) -> None:
+        self.config_parser.set(_SECTION_, "option4", "none")
+        self.config_parser.set(_SECTION_, "option6", "[1, 3]")
+
+        result = self.config_parser.parse_section(self.dataclass, _SECTION_)
+
+        self.assertEqual((result.option4, result.option6), (None, [1, 3]))
+        annotated: typing.Any = typing_extensions.Annotated[int, {"doc": "unhashable metadata"}]
+        self.assertEqual(self.config_parser.get_typed(_SECTION_, "option1", annotated), 5)
+        self.config_parser.set(_SECTION_, "option6", "[4]")
+        with self.assertRaisesRegex(ParseError, "Value 4 is greater than maximum 3"):
+            self.config_parser.parse_section(self.dataclass, _SECTION_)
+
+    def test_in_union(self) -> None:
+        optional: typing.Any = typing.Optional[typing_extensions.Annotated[int, Range(min=1)]]
+        union: typing.Any = typing.Union[typing.List[typing_extensions.Annotated[int, Range(max=3)]], bool]
+        self.config_parser.set(_SECTION_, "option1", "0")
+        self.config_parser.set(_SECTION_, "option2", "[1, 5]")
+
+        with self.assertRaisesRegex(ParseError, "option 'option1': Value 0 is less than minimum 1$"):
+            self.config_parser.get_typed(_SECTION_, "option1", optional)
+        with self.assertRaisesRegex(ParseError, "option 'option2': Value 5 is greater than maximum 3$"):
+            self.config_parser.get_typed(_SECTION_, "option2", union)
+        self.assertEqual(self.config_parser.get_typed(_SECTION_, "option7", optional, fallback=None), None)
+        self.config_parser.set(_SECTION_, "option1", "foo")
+        with self.assertRaisesRegex(
+            ParseError,
+            re.escape("Cannot cast value 'foo' to '(Annotated[int, Range(min=1, max=None)]|NoneType)' type"),
+        ):
+            self.config_parser.get_typed(_SECTION_, "option1", optional)
+        literal: typing.Any = typing.Union[typing.Dict[str, int], typing.Literal["a", "b"]]
+        with self.assertRaisesRegex(ParseError, re.escape("to '(dict[str, int]|Literal['a', 'b'])' type")):
+            self.config_parser.get_typed(_SECTION_, "option1", literal)
+
+    def test_invalid(self) -> None:
+        cases = [
+            ("option1", "11", "Value 11 is greater than maximum 10"),
+            ("option1", "0", "Value 0 is less than minimum 1"),
+            ("option2", "Foo", "Value 'Foo' does not match pattern '\\[a-z\\]\\+'"),
+            ("option2", "foobar", "Length 6 of value 'foobar' is greater than maximum 5"),
+            ("option3", "[a, c]", "Value 'c' is not one of 'a', 'b'"),
+            ("option4", "0.1", "Value 0.1 is less than minimum 0.5"),
+            ("option5", "10", "object of type 'int' has no len\\(\\)"),
+        ]
+        for option, value, message in cases:
+            config_parser = ConfigParser()
+            config_parser.read_dict({_SECTION_: {"option1": "5", "option2": "foo", "option3": "[a]", option: value}})
+            with self.assertRaisesRegex(
+                ParseError, f"ParseError in section '{_SECTION_}' for option '{option}': {message}"
+            ):
+                config_parser.parse_section(self.dataclass, _SECTION_)
+
+
+class TestFastReader(unittest.TestCase):
+    def read(self, parser: configparser.RawConfigParser, text: str) -> typing.Any:
+        try:
+            parser.read_string(text)
+        except Exception as e:
+            return type(e), str(e)
+        sections = getattr(parser, "_sections")
+        return parser.sections(), dict(getattr(parser, "_defaults")), {k: dict(v) for k, v in sections.items()}
+
+    def assertSameRead(self, text: str, **kwargs: typing.Any) -> None:
+        expected = self.read(configparser.ConfigParser(**kwargs), text)
+        parser = ConfigParser(reader="fast", **kwargs)
+        # Python 3.13 always uses the standard library reader
+        self.assertEqual(supports_fast_read(parser), sys.version_info < (3, 13))
+        self.assertEqual(self.read(parser, text), expected, msg=f"{text!r} {kwargs}")
+
+    def test_differential(self) -> None:
+        for kwargs in _READER_CONFIGS_:
+            for text in _READER_INPUTS_:
+                self.assertSameRead(text, **kwargs)
+
+    def test_differential_random(self) -> None:
+        tokens = ["[a]", "[b]", "[DEFAULT]", "x", "y", "=", ":", "=>", " ", "  ", "\t", "#", ";", "//", "v", "[", "]", ""]
+        rnd = random.Random(26)
+        for _ in range(300):
+            lines = ["".join(rnd.choice(tokens) for _ in range(rnd.randint(0, 5))) for _ in range(rnd.randint(1, 12))]
+            text = "\n".join(lines)
+            self.assertSameRead(text, **rnd.choice(_READER_CONFIGS_))
+
+    def test_unsupported_parser(self) -> None:
+        class CustomParser(ConfigParser):
+            SECTCRE = re.compile(r"<(?P<header>[^>]+)>")
+
+        parser = CustomParser(reader="fast")
+        self.assertFalse(supports_fast_read(parser))
+        parser.read_string("<a>\nx = 1\n")
+        self.assertEqual(parser.get("a", "x"), "1")
+
+
+class TestCli(unittest.TestCase):
+    def run_cli(self, *args: str) -> typing.Tuple[int, typing.List[typing.Dict[str, typing.Any]]]:
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = cli.main(["validate", *args])
+        return code, [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def test_validate(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            Path(tmp, "a.ini").write_text("[service:a]\noption1 = 1\noption2 = [foo]\n")
+            Path(tmp, "b.ini").write_text("[service:b]\noption1 = foo\noption2 = [foo]\n")
+            Path(tmp, "c.ini").write_text("[main]\noption1 = 1\noption2 = [foo]\n")
+            for jobs in ("1", "2"):
+                code, results = self.run_cli(
+                    "-s",
+                    "service:*=tests.tests:CliDataclass",
+                    "-j",
+                    jobs,
+                    str(Path(tmp, "*.ini")),
+                    str(Path(tmp, "x.ini")),
+                )
+
+                self.assertEqual(code, 1)
+                self.assertEqual([Path(r["file"]).name for r in results], ["a.ini", "b.ini", "c.ini", "x.ini"])
+                self.assertEqual([r["ok"] for r in results], [True, False, True, False])
+                self.assertEqual([r["sections"] for r in results], [1, 0, 0, 0])
+                self.assertEqual(
+                    results[1]["errors"],
+                    [{"section": "service:b", "option": "option1", "message": "Cannot cast value 'foo' to 'int'"}],
+                )
+                self.assertIn("elapsed_ms", results[0])
+
+            code, results = self.run_cli("-s", "main=tests.tests:CliDataclass", str(Path(tmp, "c.ini")))
+            self.assertEqual((code, results[0]["ok"]), (0, True))
+
+            code, results = self.run_cli("-s", "main=tests.tests:CliDataclass", str(Path(tmp, "x.ini")))
+            self.assertEqual(code, 1)
+            self.assertEqual(results[0]["errors"], [{"section": None, "option": None, "message": "Unable to read file"}])
+
+            code, results = self.run_cli("-s", "main=tests.tests:CliDataclass", str(Path(tmp, "*.cfg")))
+            self.assertEqual((code, results), (2, []))
+
+    def test_validate_invalid_schema(self) -> None:
+        code, results = self.run_cli("-s", "tests.tests:TestCli", "a.ini")
+        self.assertEqual((code, results), (2, []))
+
+
+class TestConfigDiff(unittest.TestCase):
+    def test_diff(self) -> None:
+        old = ConfigParser()
+        old.read_string("[DEFAULT]\nshared = 1\n[a]\nx = 1\ny = [1, 2]\n[b]\nx = 1\n[c]\nx = 1\n[d]\nz = 1\n")
+        new = ConfigParser()
+        new.read_string("[DEFAULT]\nshared = 2\n[a]\nx = 1\ny = [1, 3]\nz = 0\n[b]\nx = 1\n[d]\nz = 1\n[e]\nx = 1\n")
+        new.set("d", "shared", "1")
+
+        result = old.diff(new)
+
+        self.assertEqual(result.added_sections, ("e",))
+        self.assertEqual(result.removed_sections, ("c",))
+        self.assertEqual(
+            dict(result.changed_sections),
+            {
+                "DEFAULT": SectionDiff(changed=("shared",)),
+                "a": SectionDiff(added=("z",), changed=("shared", "y")),
+                "b": SectionDiff(changed=("shared",)),
+            },
+        )
+
+    def test_diff_unchanged(self) -> None:
+        old = ConfigParser()
+        old.read_string("[a]\nx = 1\n")
+        new = ConfigParser()
+        new.read_string("[a]\nx = 1\n")
+
+        result = old.diff(new)
+
+        self.assertEqual(result, ConfigDiff())
+        self.assertFalse(result)
+
+
+@dataclasses.dataclass(frozen=True)
+class HolderDataclass:
+    option1: int
+    option2: int
+
+
+class TestConfigHolder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name, "config.ini")
+        self.holder = ConfigHolder({"main": HolderDataclass, "service:*": HolderDataclass})
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write(self, value: int, services: int = 1) -> None:
+        content = f"[main]\noption1 = {value}\noption2 = {value}\n"
+        content += "".join(f"[service:{i}]\noption1 = {i}\noption2 = {value}\n" for i in range(services))
+        self.path.write_text(content)
+
+    def test_reload_extra_fields(self) -> None:
+        self.path.write_text("[DEFAULT]\nowner = ops\n[main]\noption1 = 1\noption2 = 2\nextra_option = 3\n")
+
+        generation = self.holder.reload(str(self.path))
+
+        self.assertEqual(generation["main"], HolderDataclass(1, 2))
+        self.assertFalse(hasattr(generation["main"], "extra_option"))
+
+    def test_reload(self) -> None:
+        self.assertEqual(self.holder.current.number, 0)
+        self.assertNotIn("main", self.holder.current)
+
+        self.write(1, services=2)
+        first = self.holder.reload(str(self.path))
+        self.write(2, services=1)
+        second = self.holder.reload(str(self.path))
+
+        self.assertIs(self.holder.current, second)
+        self.assertEqual((first.number, second.number), (1, 2))
+        self.assertEqual(first.files, (str(self.path),))
+        self.assertEqual(list(first.sections), ["main", "service:0", "service:1"])
+        self.assertEqual(first["main"], HolderDataclass(1, 1))
+        self.assertEqual(list(second.sections), ["main", "service:0"])
+        self.assertEqual(second["service:0"], HolderDataclass(0, 2))
+        with self.assertRaises(TypeError):
+            second.sections["main"] = HolderDataclass(3, 3)  # type: ignore[index]
+
+        # A failed reload keeps the current generation
+        self.path.write_text("[main]\noption1 = x\n")
+        with self.assertRaises(ParseError):
+            self.holder.reload(str(self.path))
+        self.assertIs(self.holder.current, second)
+
+    def test_concurrent_readers(self) -> None:
+        self.write(0)
+        self.holder.reload(str(self.path))
+        stop = threading.Event()
+        inconsistent = []
+
+        def read() -> None:
+            while not stop.is_set():
+                generation = self.holder.current
+                main, service = generation["main"], generation["service:0"]
+                if main.option1 != main.option2 or main.option2 != service.option2:
+                    inconsistent.append(generation.number)
+
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        for reader in readers:
+            reader.start()
+        try:
+            for value in range(1, 11):
+                self.write(value)
+                self.holder.reload(str(self.path))
+        finally:
+            stop.set()
+            for reader in readers:
+                reader.join()
+
+        self.assertEqual(inconsistent, [])
+        self.assertEqual(self.holder.current.number, 11)
+
+
+class TestConfigStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        for i, tenant in enumerate("abc"):
+            self.write(tenant, i)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write(self, tenant: str, value: int, mtime_ns: int = 10**18) -> None:
+        path = Path(self.tmp.name, f"{tenant}.ini")
+        path.write_text(f"[main]\noption1 = {value}\noption2 = {value}\n")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def store(self, **kwargs: typing.Any) -> ConfigStore:
+        return ConfigStore(os.path.join(self.tmp.name, "{tenant}.ini"), {"main": HolderDataclass}, **kwargs)
+
+    def test_lru(self) -> None:
+        store = self.store(max_entries=2)
+
+        self.assertEqual(store.get("a")["main"], HolderDataclass(0, 0))
+        self.assertIs(store.get("a"), store.get("a"))
+        store.get("b")
+        store.get("a")
+        store.get("c")
+
+        self.assertEqual((sorted(store.tenants()), len(store)), (["a", "c"], 2))
+        stats = store.stats()
+        self.assertEqual(stats, StoreStats(hits=3, misses=3, loads=3, evictions=1, entries=2, bytes=stats.bytes))
+        self.assertGreater(stats.bytes, 0)
+
+        with self.assertRaises(FileNotFoundError):
+            store.get("missing")
+        self.write("d", "x")  # type: ignore[arg-type]
+        with self.assertRaises(ParseError):
+            store.get("d")
+        self.assertEqual(sorted(store.tenants()), ["a", "c"])
+
+        store = self.store(max_entries=None, max_bytes=stats.bytes // 2)
+        store.get("a")
+        store.get("b")
+        self.assertEqual((store.tenants(), store.stats().evictions), (["b"], 1))
+
+    def test_revalidate(self) -> None:
+        store = self.store()
+        first = store.get("a")
+        self.write("a", 5, mtime_ns=10**18 + 1)
+        second = store.get("a")
+
+        self.assertEqual((first.number, first["main"].option1), (1, 0))
+        self.assertEqual((second.number, second["main"].option1), (2, 5))
+        self.assertIs(store.get("a"), second)
+
+        store = self.store(check_interval=3600)
+        first = store.get("a")
+        self.write("a", 6, mtime_ns=10**18 + 2)
+        self.assertIs(store.get("a"), first)
+        store.invalidate("a")
+        self.assertEqual(store.get("a")["main"].option1, 6)
+
+    def test_single_flight(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def parser_factory() -> ConfigParser:
+            started.set()
+            release.wait(5)
+            return ConfigParser()
+
+        store = self.store(parser_factory=parser_factory)
+        results: typing.List[typing.Any] = []
+        threads = [threading.Thread(target=lambda: results.append(store.get("a"))) for _ in range(4)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        while store.stats().misses < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual((store.stats().loads, store.stats().misses), (1, 4))
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    def test_profile(self) -> None:
+        @dataclasses.dataclass
+        class TestDataclass:
+            option1: int
+            option2: typing.List[str]
+
+        config_parser = ConfigParser()
+        with MemoryProfiler(config_parser) as report:
+            config_parser.read_string(
+                "[small]\noption1 = 1\noption2 = [a]\n[big]\noption1 = 2\noption2 = [" + "x, " * 100 + "y]\nextra = z\n",
+                source="app.ini",
+            )
+            config_parser.parse_matching("*", TestDataclass)
+        config_parser.parse_section(TestDataclass, "small")
+
+        self.assertNotIn("parse_section", vars(config_parser))
+        self.assertNotIn("_read", vars(config_parser))
+        self.assertEqual(list(report.files), ["app.ini"])
+        self.assertGreater(report.files["app.ini"], 0)
+        self.assertEqual([s.section for s in report.top()], ["big", "small"])
+        big = report.sections["big"]
+        self.assertEqual(list(big.fields), ["option1", "option2", "extra"])
+        self.assertEqual(big.fields["option1"], FieldMemory(raw=sys.getsizeof("2"), converted=sys.getsizeof(2)))
+        self.assertGreater(big.fields["option2"].converted, big.fields["option2"].raw)
+        self.assertGreater(big.raw, report.sections["small"].raw)
+        self.assertGreater(big.converted, report.sections["small"].converted)
+        self.assertEqual(len(report.snapshots), 2)
+        self.assertIn("big", report.summary(limit=1))
+        self.assertNotIn("small  ", report.summary(limit=1))
+        self.assertTrue(report.allocations())
+
 
 def start_test() -> None:
     unittest.main()
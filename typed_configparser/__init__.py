@@ -1,7 +1,40 @@
 """Fully typed configparser"""
 
-from .parser import ConfigParser
+from .constraints import Choices, Constraint, Length, Pattern, Range
+from .converters import ConverterRegistry
+from .diff import ConfigDiff, SectionDiff, diff_configs
+from .generations import ConfigHolder, Generation
+from .interning import InternPool, InternReport
+from .memory import FieldMemory, MemoryProfiler, MemoryReport, SectionMemory
+from .parser import ConfigParser, Records, Section, enum_converter, literal_converter, parse_duration
+from .store import ConfigStore, StoreStats
 
 __version__ = "1.1.0"
 
-__all__ = ["ConfigParser"]
+__all__ = [
+    "ConfigParser",
+    "Section",
+    "Records",
+    "ConverterRegistry",
+    "Constraint",
+    "Range",
+    "Length",
+    "Pattern",
+    "Choices",
+    "ConfigDiff",
+    "SectionDiff",
+    "InternPool",
+    "InternReport",
+    "diff_configs",
+    "enum_converter",
+    "literal_converter",
+    "parse_duration",
+    "ConfigHolder",
+    "Generation",
+    "ConfigStore",
+    "StoreStats",
+    "MemoryProfiler",
+    "MemoryReport",
+    "SectionMemory",
+    "FieldMemory",
+]
@@ -0,0 +1,241 @@
+"""
+Command line interface.
+
+    python -m typed_configparser validate --schema SECTION=MODULE:DATACLASS [options] FILE_OR_GLOB...
+
+Validates configuration files against dataclasses, across a pool of processes. One JSON line
+is written to stdout per file, e.g.
+
+    {"file": "a.ini", "ok": false, "sections": 1, "errors": [{"section": "db", "option": "port", ...}], ...}
+
+"""
+
+import argparse
+import concurrent.futures
+import configparser
+import glob
+import importlib
+import json
+import os
+import sys
+import time
+import typing
+
+from typed_configparser.exceptions import ParseError
+from typed_configparser.index import has_wildcards
+from typed_configparser.parser import ConfigParser, is_dataclass, resolve_type_hints
+
+# (section name or pattern, "module:dataclass") pairs as given on the command line
+SchemaSpec = typing.List[typing.Tuple[str, str]]
+Schema = typing.List[typing.Tuple[str, typing.Any]]
+
+# Schema resolved once per worker process by _init_worker
+_WORKER_SCHEMA_: Schema = []
+_WORKER_OPTIONS_: typing.Dict[str, typing.Any] = {}
+
+
+def parse_schema_spec(value: str) -> typing.Tuple[str, str]:
+    """
+    Parse a schema argument of the form [SECTION=]MODULE:DATACLASS. SECTION may be a shell-style
+    pattern (see ConfigParser.sections_matching) and defaults to the name of the dataclass.
+    """
+    section, _, target = value.rpartition("=")
+    module, _, name = target.partition(":")
+    if not module or not name:
+        raise argparse.ArgumentTypeError(f"invalid schema '{value}', expected [SECTION=]MODULE:DATACLASS")
+    return section or name.rpartition(".")[2], target
+
+
+def load_schema(specs: SchemaSpec) -> Schema:
+    """
+    Import dataclasses of a schema and prepare them for parsing.
+
+    Args:
+        specs (SchemaSpec): Pairs of section name (or pattern) and "module:dataclass".
+
+    Returns:
+        Schema: Pairs of section name (or pattern) and dataclass.
+
+    Raises:
+        ImportError: If a module cannot be imported.
+        TypeError: If the target is not a dataclass.
+
+    """
+    schema = []
+    for section, target in specs:
+        module_name, _, name = target.partition(":")
+        obj: typing.Any = importlib.import_module(module_name)
+        for attr in name.split("."):
+            obj = getattr(obj, attr)
+        if not is_dataclass(obj):
+            raise TypeError(f"'{target}' is not a dataclass")
+        # Resolve type hints now so they are resolved once per process and not once per file
+        resolve_type_hints(obj)
+        schema.append((section, obj))
+    return schema
+
+
+def expand_paths(patterns: typing.Iterable[str]) -> typing.List[str]:
+    """
+    Expand glob patterns (** matches directories recursively). Paths without wildcards are kept as is,
+    even if they don't exist, so that they are reported as unreadable.
+
+    Raises:
+        ValueError: If a glob pattern doesn't match any file.
+
+    """
+    paths: typing.Dict[str, None] = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if has_wildcards(pattern) else [pattern]
+        if not matches:
+            raise ValueError(f"no files match '{pattern}'")
+        for path in matches:
+            if not os.path.isdir(path):
+                paths[path] = None
+    return list(paths)
+
+
+def _error(section: typing.Optional[str], option: typing.Optional[str], message: str) -> typing.Dict[str, typing.Any]:
+    return {"section": section, "option": option, "message": message}
+
+
+def validate_file(
+    filename: str,
+    schema: Schema,
+    extra: typing.Literal["allow", "ignore", "error"] = "allow",
+    reader: typing.Literal["stdlib", "fast"] = "stdlib",
+) -> typing.Dict[str, typing.Any]:
+    """
+    Validate a configuration file against a schema.
+
+    Args:
+        filename (str): The configuration file.
+        schema (Schema): Pairs of section name (or pattern) and dataclass.
+        extra (Literal["allow", "ignore", "error"], optional): How to handle extra fields. See parse_section.
+        reader (Literal["stdlib", "fast"], optional): Engine used to read the file. See ConfigParser.
+
+    Returns:
+        Dict[str, Any]: The result with file, ok, number of sections parsed, errors and elapsed_ms.
+
+    """
+    start = time.perf_counter()
+    errors = []
+    sections = 0
+    parser = ConfigParser(reader=reader)
+    try:
+        read_ok = parser.read(filename)
+    except configparser.Error as e:
+        errors.append(_error(None, None, str(e)))
+    else:
+        if not read_ok:
+            errors.append(_error(None, None, "Unable to read file"))
+        # The sections of a file which can't be read are not validated, they would all be missing
+        for section, using_dataclass in schema if read_ok else []:
+            names = parser.sections_matching(section) if has_wildcards(section) else [section]
+            for name in names:
+                try:
+                    parser.parse_section(using_dataclass, name, extra=extra)
+                    sections += 1
+                except ParseError as e:
+                    errors.append(_error(e.section, e.option, e.args[0]))
+                except configparser.Error as e:
+                    errors.append(_error(name, None, str(e)))
+                except Exception as e:
+                    # Raised by the dataclass itself e.g. in __post_init__
+                    errors.append(_error(name, None, f"{type(e).__name__}: {e}"))
+    return {
+        "file": filename,
+        "ok": not errors,
+        "sections": sections,
+        "errors": errors,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
+
+
+def _init_worker(specs: SchemaSpec, options: typing.Dict[str, typing.Any]) -> None:
+    global _WORKER_SCHEMA_, _WORKER_OPTIONS_
+    _WORKER_SCHEMA_ = load_schema(specs)
+    _WORKER_OPTIONS_ = options
+
+
+def _validate_in_worker(filename: str) -> typing.Dict[str, typing.Any]:
+    return validate_file(filename, _WORKER_SCHEMA_, **_WORKER_OPTIONS_)
+
+
+def validate(
+    files: typing.List[str],
+    specs: SchemaSpec,
+    jobs: int,
+    options: typing.Dict[str, typing.Any],
+) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    """
+    Validate files against a schema, across a pool of jobs processes. Schema is loaded once per
+    process. Results are yielded in the order of files.
+    """
+    # Load the schema in this process too, so that errors are raised here and not in the workers
+    schema = load_schema(specs)
+    if jobs <= 1 or len(files) <= 1:
+        for filename in files:
+            yield validate_file(filename, schema, **options)
+        return
+
+    # Send files in chunks to reduce inter-process communication for many small files
+    chunksize = max(1, min(64, len(files) // (jobs * 4)))
+    with concurrent.futures.ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(specs, options)) as pool:
+        yield from pool.map(_validate_in_worker, files, chunksize=chunksize)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m typed_configparser", description="Typed configparser tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    validate_ = commands.add_parser(
+        "validate",
+        help="validate configuration files against dataclasses",
+        description="Validate configuration files against dataclasses. Writes one JSON line per file to stdout.",
+    )
+    validate_.add_argument("files", nargs="+", metavar="FILE", help="configuration files or glob patterns")
+    validate_.add_argument(
+        "-s",
+        "--schema",
+        action="append",
+        required=True,
+        type=parse_schema_spec,
+        metavar="[SECTION=]MODULE:DATACLASS",
+        help="dataclass to validate a section with, SECTION may be a pattern e.g. 'service:*'. Can be repeated.",
+    )
+    validate_.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="number of processes")
+    validate_.add_argument("--extra", choices=["allow", "ignore", "error"], default="allow", help="extra fields")
+    validate_.add_argument("--reader", choices=["stdlib", "fast"], default="fast", help="engine used to read files")
+    return parser
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    """
+    Run the command line interface.
+
+    Returns:
+        int: Exit code, 0 if all files are valid, 1 if any file is invalid and 2 for usage errors.
+
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        files = expand_paths(args.files)
+    except ValueError as e:
+        sys.stderr.write(f"error: {e}\n")
+        return 2
+    options = {"extra": args.extra, "reader": args.reader}
+
+    try:
+        load_schema(args.schema)
+    except (ImportError, AttributeError, TypeError) as e:
+        sys.stderr.write(f"error: unable to load schema: {e}\n")
+        return 2
+
+    start = time.perf_counter()
+    failed = 0
+    for result in validate(files, args.schema, args.jobs, options):
+        failed += not result["ok"]
+        sys.stdout.write(json.dumps(result) + "\n")
+
+    sys.stderr.write(f"{len(files)} files validated, {failed} failed in {time.perf_counter() - start:.3f}s\n")
+    return 1 if failed else 0
@@ -0,0 +1,81 @@
+import dataclasses
+import re
+import typing
+
+
+class Constraint:
+    """
+    Base class of constraints used as typing.Annotated metadata, e.g. Annotated[int, Range(min=1)].
+    Constraints are checked by parse_section right after a value is cast to its type, except for
+    None (the value of an unset Optional).
+    """
+
+    def check(self, value: typing.Any) -> None:
+        """
+        Check a converted value.
+
+        Raises:
+            ValueError: If the value doesn't satisfy the constraint, with the reason as message.
+            TypeError: If the constraint doesn't apply to the type of the value.
+
+        """
+        raise NotImplementedError  # pragma: no cover
+
+
+@dataclasses.dataclass(frozen=True)
+class Range(Constraint):
+    """Value must be within min and max (both inclusive). Either bound can be omitted."""
+
+    min: typing.Any = None
+    max: typing.Any = None
+
+    def check(self, value: typing.Any) -> None:
+        if self.min is not None and value < self.min:
+            raise ValueError(f"Value {value!r} is less than minimum {self.min!r}")
+        if self.max is not None and value > self.max:
+            raise ValueError(f"Value {value!r} is greater than maximum {self.max!r}")
+
+
+@dataclasses.dataclass(frozen=True)
+class Length(Constraint):
+    """Length of value must be within min and max (both inclusive). Either bound can be omitted."""
+
+    min: typing.Optional[int] = None
+    max: typing.Optional[int] = None
+
+    def check(self, value: typing.Any) -> None:
+        length = len(value)
+        if self.min is not None and length < self.min:
+            raise ValueError(f"Length {length} of value {value!r} is less than minimum {self.min}")
+        if self.max is not None and length > self.max:
+            raise ValueError(f"Length {length} of value {value!r} is greater than maximum {self.max}")
+
+
+@dataclasses.dataclass(frozen=True)
+class Pattern(Constraint):
+    """Value must fully match the regular expression. The expression is compiled once."""
+
+    regex: str
+    flags: int = 0
+    _compiled: "typing.Pattern[str]" = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_compiled", re.compile(self.regex, self.flags))
+
+    def check(self, value: typing.Any) -> None:
+        if self._compiled.fullmatch(value if isinstance(value, str) else str(value)) is None:
+            raise ValueError(f"Value {value!r} does not match pattern '{self.regex}'")
+
+
+@dataclasses.dataclass(frozen=True, init=False)
+class Choices(Constraint):
+    """Value must be one of the given values."""
+
+    values: typing.Tuple[typing.Any, ...]
+
+    def __init__(self, *values: typing.Any) -> None:
+        object.__setattr__(self, "values", values)
+
+    def check(self, value: typing.Any) -> None:
+        if value not in self.values:
+            raise ValueError(f"Value {value!r} is not one of {', '.join(repr(v) for v in self.values)}")
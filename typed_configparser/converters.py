@@ -0,0 +1,134 @@
+import typing
+
+# Converts the raw value of an option, called with (section, option, value)
+Converter = typing.Callable[[str, str, str], typing.Any]
+# Casts a raw value to a type as returned by get_types, used by generic converters for the items
+CastFunction = typing.Callable[[str, typing.Any], typing.Any]
+# Converts the raw value of an option to a generic type e.g. List[int],
+# called with (section, option, value, type arguments, cast function)
+GenericConverter = typing.Callable[[str, str, str, typing.List[typing.Any], CastFunction], typing.Any]
+# Builds the converter of a type, e.g. for every subclass of Enum
+ConverterFactory = typing.Callable[[typing.Any], Converter]
+
+
+class ConverterRegistry:
+    """
+    Registry of converters used by cast_value to convert raw values to types.
+
+    Converters are looked up with a dict access by type, and generic converters by the origin of a
+    generic type (e.g. list for List[int]). If a type has no converter of its own, the converter of
+    the nearest base class registered with inherit set to True is used, or a converter is built for
+    the type by the factory of the nearest base class (e.g. a value to member lookup for every Enum).
+    The result of this lookup is cached per type.
+
+    Converters keeping a cache of their own (e.g. the Literal converter) have a copy method, which
+    copy calls so that registries never share mutable state.
+
+    """
+
+    def __init__(
+        self,
+        converters: typing.Optional[typing.Mapping[typing.Any, Converter]] = None,
+        generic_converters: typing.Optional[typing.Mapping[typing.Any, GenericConverter]] = None,
+        inheritable: typing.Iterable[typing.Any] = (),
+        factories: typing.Optional[typing.Mapping[typing.Any, ConverterFactory]] = None,
+    ) -> None:
+        self._converters: typing.Dict[typing.Any, Converter] = dict(converters or {})
+        self._generic_converters: typing.Dict[typing.Any, GenericConverter] = dict(generic_converters or {})
+        self._inheritable = set(inheritable)
+        self._factories: typing.Dict[typing.Any, ConverterFactory] = dict(factories or {})
+        self._cache: typing.Dict[typing.Any, typing.Optional[Converter]] = {}
+
+    def register(self, typ: typing.Any, converter: Converter, inherit: bool = True) -> None:
+        """
+        Register a converter for a type.
+
+        Args:
+            typ (Any): The type to convert values to.
+            converter (Converter): The converter, called with section, option and raw value.
+            inherit (bool, optional): Use the converter for subclasses of typ which have no converter
+                of their own. Defaults to True.
+
+        """
+        self._converters[typ] = converter
+        if inherit:
+            self._inheritable.add(typ)
+        else:
+            self._inheritable.discard(typ)
+        self._cache.clear()
+
+    def register_factory(self, base: typing.Any, factory: ConverterFactory) -> None:
+        """
+        Register a factory building the converters of the subclasses of a base class.
+
+        Args:
+            base (Any): The base class, e.g. Enum.
+            factory (ConverterFactory): Called once per subclass with the subclass, returns its converter.
+
+        """
+        self._factories[base] = factory
+        self._cache.clear()
+
+    def register_generic(self, origin: typing.Any, converter: GenericConverter) -> None:
+        """
+        Register a converter for a generic type.
+
+        Args:
+            origin (Any): The origin of the generic type, as returned by typing.get_origin.
+            converter (GenericConverter): The converter, called with section, option, raw value, type
+                arguments and a function to cast items to one of the type arguments.
+
+        """
+        self._generic_converters[origin] = converter
+
+    def lookup(self, typ: typing.Any) -> typing.Optional[Converter]:
+        """
+        Get the converter for a type.
+
+        Args:
+            typ (Any): The type to convert values to.
+
+        Returns:
+            Optional[Converter]: The converter, or None if no converter is registered for the type
+                or any of its base classes.
+
+        """
+        try:
+            return self._cache[typ]
+        except KeyError:
+            pass
+        except TypeError:  # pragma: no cover
+            return None
+
+        converter = self._converters.get(typ)
+        if converter is None:
+            for base in getattr(typ, "__mro__", ())[1:]:
+                if base in self._inheritable:
+                    converter = self._converters[base]
+                    break
+                if base in self._factories:
+                    converter = self._factories[base](typ)
+                    break
+        self._cache[typ] = converter
+        return converter
+
+    def lookup_generic(self, origin: typing.Any) -> typing.Optional[GenericConverter]:
+        """
+        Get the converter for a generic type.
+
+        Args:
+            origin (Any): The origin of the generic type.
+
+        Returns:
+            Optional[GenericConverter]: The converter, or None if no converter is registered for origin.
+
+        """
+        return self._generic_converters.get(origin)
+
+    def copy(self) -> "ConverterRegistry":
+        """Get a copy of the registry, converters registered on the copy don't affect this registry"""
+        generic_converters = {
+            origin: converter.copy() if hasattr(converter, "copy") else converter
+            for origin, converter in self._generic_converters.items()
+        }
+        return ConverterRegistry(self._converters, generic_converters, self._inheritable, self._factories)
@@ -0,0 +1,130 @@
+import configparser
+import dataclasses
+import typing
+
+RawOptions = typing.Mapping[str, typing.Optional[str]]
+
+
+@dataclasses.dataclass(frozen=True)
+class SectionDiff:
+    """
+    Options which differ in a configuration section between two configuration states.
+
+    Attributes:
+        added (Tuple[str, ...]): Options found only in the new state.
+        removed (Tuple[str, ...]): Options found only in the old state.
+        changed (Tuple[str, ...]): Options found in both states with a different raw value.
+
+    """
+
+    added: typing.Tuple[str, ...] = ()
+    removed: typing.Tuple[str, ...] = ()
+    changed: typing.Tuple[str, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+@dataclasses.dataclass(frozen=True)
+class ConfigDiff:
+    """
+    Sections and options which differ between two configuration states.
+
+    Attributes:
+        added_sections (Tuple[str, ...]): Sections found only in the new state.
+        removed_sections (Tuple[str, ...]): Sections found only in the old state.
+        changed_sections (Mapping[str, SectionDiff]): Sections found in both states with
+            different options. The default section is included if any of its options changed.
+
+    """
+
+    added_sections: typing.Tuple[str, ...] = ()
+    removed_sections: typing.Tuple[str, ...] = ()
+    changed_sections: typing.Mapping[str, SectionDiff] = dataclasses.field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.added_sections or self.removed_sections or self.changed_sections)
+
+
+def diff_options(
+    old: RawOptions,
+    new: RawOptions,
+    old_defaults: RawOptions = {},
+    new_defaults: RawOptions = {},
+    inherited: typing.AbstractSet[str] = frozenset(),
+) -> SectionDiff:
+    """
+    Compare raw options of a section. Options missing in the section fall back to defaults.
+
+    Only options whose raw (option, value) pair differs and options in inherited are looked at,
+    so unchanged options are skipped using the hashes of the raw strings and are never converted.
+
+    Args:
+        old (RawOptions): Raw options of the section in the old state.
+        new (RawOptions): Raw options of the section in the new state.
+        old_defaults (RawOptions, optional): Raw default options in the old state.
+        new_defaults (RawOptions, optional): Raw default options in the new state.
+        inherited (AbstractSet[str], optional): Default options which changed between the states.
+
+    Returns:
+        SectionDiff: The options which differ between the states.
+
+    """
+    if old is new or old == new:
+        candidates = set(inherited)
+    else:
+        candidates = {option for option, _ in old.items() ^ new.items()} | inherited
+
+    added, removed, changed = [], [], []
+    for option in sorted(candidates):
+        in_old = option in old or option in old_defaults
+        in_new = option in new or option in new_defaults
+        if in_old and in_new:
+            old_value = old[option] if option in old else old_defaults[option]
+            new_value = new[option] if option in new else new_defaults[option]
+            if old_value != new_value:
+                changed.append(option)
+        elif in_new:
+            added.append(option)
+        elif in_old:
+            removed.append(option)
+    return SectionDiff(tuple(added), tuple(removed), tuple(changed))
+
+
+def diff_configs(old: configparser.RawConfigParser, new: configparser.RawConfigParser) -> ConfigDiff:
+    """
+    Compare two configuration states using raw option values only. Values are never converted,
+    so no dataclass is required and large container values cost a single string comparison.
+
+    Args:
+        old (RawConfigParser): The old configuration state.
+        new (RawConfigParser): The new configuration state.
+
+    Returns:
+        ConfigDiff: The sections and options which differ between the states.
+
+    """
+    old_sections: typing.Mapping[str, RawOptions] = old._sections  # type: ignore[attr-defined]
+    new_sections: typing.Mapping[str, RawOptions] = new._sections  # type: ignore[attr-defined]
+    old_defaults: RawOptions = old._defaults  # type: ignore[attr-defined]
+    new_defaults: RawOptions = new._defaults  # type: ignore[attr-defined]
+
+    changed_sections = {}
+    defaults_diff = diff_options(old_defaults, new_defaults)
+    if defaults_diff:
+        changed_sections[new.default_section] = defaults_diff
+    inherited = set(defaults_diff.added + defaults_diff.removed + defaults_diff.changed)
+
+    for section, new_options in new_sections.items():
+        old_options = old_sections.get(section)
+        if old_options is None or (not inherited and (old_options is new_options or old_options == new_options)):
+            continue
+        section_diff = diff_options(old_options, new_options, old_defaults, new_defaults, inherited)
+        if section_diff:
+            changed_sections[section] = section_diff
+
+    return ConfigDiff(
+        added_sections=tuple(section for section in new_sections if section not in old_sections),
+        removed_sections=tuple(section for section in old_sections if section not in new_sections),
+        changed_sections=changed_sections,
+    )
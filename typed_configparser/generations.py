@@ -0,0 +1,166 @@
+import dataclasses
+import threading
+import types
+import typing
+
+from typed_configparser.index import has_wildcards
+from typed_configparser.parser import ConfigParser
+
+# Section name (or shell-style pattern, see ConfigParser.sections_matching) to dataclass
+Schema = typing.Mapping[str, typing.Any]
+
+
+def parse_schema(
+    parser: ConfigParser,
+    schema: Schema,
+    extra: typing.Literal["allow", "ignore", "error"] = "allow",
+) -> typing.Dict[str, typing.Any]:
+    """
+    Parse all sections of a schema.
+
+    Args:
+        parser (ConfigParser): The parser holding the configuration.
+        schema (Schema): Section names or patterns, and the dataclass to parse matching sections into.
+        extra (Literal["allow", "ignore", "error"], optional): How to handle extra fields. See parse_section.
+
+    Returns:
+        Dict[str, Any]: Section name to dataclass instance.
+
+    Raises:
+        NoSectionError: If a section given by name (and not by pattern) is not found.
+        ParseError: If parsing of a section fails.
+
+    """
+    sections = {}
+    for section, using_dataclass in schema.items():
+        if has_wildcards(section):
+            sections.update(parser.parse_matching(section, using_dataclass, extra=extra))
+        else:
+            sections[section] = parser.parse_section(using_dataclass, section, extra=extra)
+    return sections
+
+
+@dataclasses.dataclass(frozen=True)
+class Generation:
+    """
+    Immutable snapshot of a parsed configuration, published by ConfigHolder.
+
+    The dataclass instances of a generation are shared by all readers and must not be modified,
+    use frozen dataclasses to enforce this.
+
+    Attributes:
+        number (int): The generation number, incremented on every reload. Generation 0 is empty.
+        sections (Mapping[str, Any]): Read-only mapping of section name to dataclass instance.
+        files (Tuple[str, ...]): The files read successfully.
+
+    """
+
+    number: int
+    sections: typing.Mapping[str, typing.Any]
+    files: typing.Tuple[str, ...] = ()
+
+    def __getitem__(self, section: str) -> typing.Any:
+        return self.sections[section]
+
+    def __contains__(self, section: object) -> bool:
+        return section in self.sections
+
+
+def load_generation(
+    number: int,
+    filenames: typing.Union[str, typing.Iterable[str]],
+    schema: Schema,
+    extra: typing.Literal["ignore", "ignore", "error"] = "ignore",
+    parser_factory: typing.Callable[[], ConfigParser] = ConfigParser,
+    encoding: typing.Optional[str] = None,
+) -> Generation:
+    """
+    Read and parse configuration files into a new generation. The parser is not kept, only the
+    dataclass instances are.
+
+    Args:
+        number (int): The number of the generation.
+        filenames (Union[str, Iterable[str]]): The configuration files, see ConfigParser.read.
+        schema (Schema): Section names or patterns, and the dataclass to parse matching sections into.
+        extra (Literal["allow", "ignore", "error"], optional): How to handle extra fields, see parse_section.
+            Extra fields can't be stored on frozen (or slotted) dataclasses. Defaults to "ignore".
+        parser_factory (Callable[[], ConfigParser], optional): Creates the parser. Defaults to ConfigParser.
+        encoding (Optional[str], optional): The encoding of the files. Defaults to None.
+
+    Returns:
+        Generation: The new generation.
+
+    """
+    parser = parser_factory()
+    files = parser.read(filenames, encoding=encoding)
+    sections = parse_schema(parser, schema, extra)
+    return Generation(number, types.MappingProxyType(sections), tuple(files))
+
+
+class ConfigHolder:
+    """
+    Holder of the current generation of a configuration, for threads reading the configuration
+    while it is reloaded.
+
+    A reload reads and parses the files into a new parser and new dataclass instances, off to the
+    side, and publishes them as a new Generation with a single reference assignment. Readers take
+    no lock: a generation obtained from current is never modified, so reading several sections of
+    the same generation is always consistent. Generations are reclaimed as soon as they are no
+    longer referenced.
+
+    Example:
+        holder = ConfigHolder({"database": Database, "service:*": Service})
+        holder.reload("app.ini")
+
+        generation = holder.current
+        generation["database"].host
+
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        extra: typing.Literal["ignore", "ignore", "error"] = "ignore",
+        parser_factory: typing.Callable[[], ConfigParser] = ConfigParser,
+    ) -> None:
+        """
+        Initialize the holder with an empty generation.
+
+        Args:
+            schema (Schema): Section names or patterns, and the dataclass to parse matching sections into.
+            extra (Literal["allow", "ignore", "error"], optional): How to handle extra fields, see parse_section.
+                Extra fields can't be stored on frozen (or slotted) dataclasses. Defaults to "ignore".
+            parser_factory (Callable[[], ConfigParser], optional): Creates the parser of every reload.
+                Defaults to ConfigParser.
+
+        """
+        self.schema = dict(schema)
+        self.extra = extra
+        self.parser_factory = parser_factory
+        self.current = Generation(0, types.MappingProxyType({}))
+        # Only serializes reloads, readers never take it
+        self._reload_lock = threading.Lock()
+
+    def reload(
+        self,
+        filenames: typing.Union[str, typing.Iterable[str]],
+        encoding: typing.Optional[str] = None,
+    ) -> Generation:
+        """
+        Read and parse configuration files, and publish them as the current generation.
+        If reading or parsing fails, the error is raised and the current generation is kept.
+
+        Args:
+            filenames (Union[str, Iterable[str]]): The configuration files, see ConfigParser.read.
+            encoding (Optional[str], optional): The encoding of the files. Defaults to None.
+
+        Returns:
+            Generation: The published generation.
+
+        """
+        with self._reload_lock:
+            generation = load_generation(
+                self.current.number + 1, filenames, self.schema, self.extra, self.parser_factory, encoding
+            )
+            self.current = generation
+        return generation
@@ -0,0 +1,81 @@
+import bisect
+import fnmatch
+import functools
+import re
+import typing
+
+_WILDCARDS_ = "*?["
+
+
+def has_wildcards(pattern: str) -> bool:
+    """Check whether a pattern contains any shell-style wildcard"""
+    return any(w in pattern for w in _WILDCARDS_)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> typing.Tuple[str, typing.Callable[[str], typing.Any]]:
+    """
+    Compile a shell-style section pattern (see fnmatch) once.
+
+    Args:
+        pattern (str): The section pattern, e.g. "service:*".
+
+    Returns:
+        Tuple[str, Callable[[str], Any]]: The literal prefix of the pattern (everything before the
+            first wildcard) and a function matching a full section name against the pattern.
+
+    """
+    end = min((i for i in (pattern.find(w) for w in _WILDCARDS_) if i > -1), default=len(pattern))
+    return pattern[:end], re.compile(fnmatch.translate(pattern)).match
+
+
+class SectionIndex:
+    """
+    Sorted index of section names used to look up sections matching a pattern.
+
+    Only names sharing the literal prefix of the pattern are looked at, so the cost of a lookup
+    depends on the number of candidate sections and not on the total number of sections.
+    The index is rebuilt lazily after it is invalidated (e.g. after reading a file).
+
+    """
+
+    def __init__(self) -> None:
+        self._names: typing.Optional[typing.List[str]] = None
+
+    def invalidate(self) -> None:
+        self._names = None
+
+    def add(self, name: str) -> None:
+        if self._names is not None:
+            bisect.insort(self._names, name)
+
+    def remove(self, name: str) -> None:
+        if self._names is not None:
+            i = bisect.bisect_left(self._names, name)
+            if i < len(self._names) and self._names[i] == name:
+                del self._names[i]
+
+    def match(self, pattern: str, sections: typing.Iterable[str]) -> typing.List[str]:
+        """
+        Get section names matching a shell-style pattern, in sorted order.
+
+        Args:
+            pattern (str): The section pattern, e.g. "service:*".
+            sections (Iterable[str]): All section names, used only when the index needs to be rebuilt.
+
+        Returns:
+            List[str]: The matching section names.
+
+        """
+        names = self._names
+        if names is None:
+            names = self._names = sorted(sections)
+        prefix, matcher = compile_pattern(pattern)
+        result = []
+        for i in range(bisect.bisect_left(names, prefix), len(names)):
+            name = names[i]
+            if not name.startswith(prefix):
+                break
+            if matcher(name):
+                result.append(name)
+        return result
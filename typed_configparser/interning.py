@@ -0,0 +1,94 @@
+import dataclasses
+import sys
+import typing
+
+
+@dataclasses.dataclass(frozen=True)
+class InternReport:
+    """
+    Statistics of an InternPool.
+
+    Attributes:
+        values (int): Number of values looked up in the pool.
+        unique (int): Number of distinct values held by the pool.
+        hits (int): Number of values replaced by an equal value already held by the pool.
+        bytes_saved (int): Approximate number of bytes freed by replacing duplicate values.
+
+    """
+
+    values: int
+    unique: int
+    hits: int
+    bytes_saved: int
+
+
+def is_poolable(value: typing.Any) -> bool:
+    """
+    Check whether a value can be shared. Only immutable values whose equality implies equal types
+    are shared, so that e.g. (1,) is never replaced by (True,) or (1.0,).
+    """
+    typ = type(value)
+    if typ is str or typ is int or value is None:
+        return True
+    if typ is tuple:
+        return all(is_poolable(item) for item in value)
+    return False
+
+
+class InternPool:
+    """
+    Pool of converted values shared across sections.
+
+    Strings and tuples (of strings, ints and tuples) are replaced by an equal value already held
+    by the pool, so repeated values across sections are stored only once. Lists and dicts are
+    mutable and are never shared, but their items are interned.
+
+    """
+
+    def __init__(self) -> None:
+        self._pool: typing.Dict[typing.Any, typing.Any] = {}
+        self._values = 0
+        self._hits = 0
+        self._bytes_saved = 0
+
+    def _pooled(self, value: typing.Any) -> typing.Any:
+        self._values += 1
+        pooled = self._pool.setdefault(value, value)
+        if pooled is not value:
+            self._hits += 1
+            self._bytes_saved += sys.getsizeof(value)
+        return pooled
+
+    def intern(self, value: typing.Any) -> typing.Any:
+        """
+        Get the pooled equivalent of a converted value.
+
+        Args:
+            value (Any): The converted value.
+
+        Returns:
+            Any: An equal value, shared with other sections where possible.
+
+        """
+        typ = type(value)
+        if typ is str:
+            return self._pooled(value)
+        elif typ is tuple:
+            value = tuple([self.intern(item) for item in value])
+            if is_poolable(value):
+                return self._pooled(value)
+            return value
+        elif typ is list:
+            return [self.intern(item) for item in value]
+        elif typ is dict:
+            return {self.intern(k): self.intern(v) for k, v in value.items()}
+        return value
+
+    def report(self) -> InternReport:
+        """Get statistics of the pool"""
+        return InternReport(self._values, len(self._pool), self._hits, self._bytes_saved)
+
+    def clear(self) -> None:
+        """Drop all pooled values and reset statistics"""
+        self._pool.clear()
+        self._values = self._hits = self._bytes_saved = 0
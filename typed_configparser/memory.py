@@ -0,0 +1,232 @@
+import dataclasses
+import functools
+import sys
+import tracemalloc
+import types
+import typing
+
+if typing.TYPE_CHECKING:
+    from typed_configparser.parser import ConfigParser
+
+_ATOMIC_ = (str, bytes, int, float, bool, type(None))
+
+
+def approximate_size(obj: typing.Any) -> int:
+    """
+    Approximate the memory used by an object and everything it references (containers, instance
+    attributes), counting shared objects once. Classes and functions are not followed.
+    """
+    seen: typing.Set[int] = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, type) or callable(item):
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, _ATOMIC_):
+            continue
+        if isinstance(item, typing.Mapping):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        if hasattr(item, "__dict__"):
+            stack.append(vars(item))
+        for slot in getattr(type(item), "__slots__", ()):
+            if hasattr(item, slot):
+                stack.append(getattr(item, slot))
+    return size
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldMemory:
+    """
+    Memory of a field of a parsed section.
+
+    Attributes:
+        raw (int): Size of the raw string value held by the parser, 0 if the option is not set.
+        converted (int): Deep size of the converted value held by the instance.
+
+    """
+
+    raw: int
+    converted: int
+
+
+@dataclasses.dataclass(frozen=True)
+class SectionMemory:
+    """
+    Memory of a section parsed by parse_section.
+
+    Attributes:
+        section (str): The name of the section.
+        raw (int): Size of the option names and raw values of the section held by the parser.
+        converted (int): Deep size of the instance, counting values shared between fields once.
+        allocated (int): Memory allocated by parse_section and still in use when it returned, as traced
+            by tracemalloc. This includes caches filled while parsing the first section of a dataclass.
+        fields (Mapping[str, FieldMemory]): Memory of every field (including extra fields).
+
+    """
+
+    section: str
+    raw: int
+    converted: int
+    allocated: int
+    fields: typing.Mapping[str, FieldMemory]
+
+
+@dataclasses.dataclass
+class MemoryReport:
+    """
+    Memory accounting collected by a MemoryProfiler.
+
+    Attributes:
+        files (Dict[str, int]): Memory allocated by reading every file (or string) and still in use
+            after reading it, as traced by tracemalloc.
+        sections (Dict[str, SectionMemory]): Memory of every parsed section, the last parse of a
+            section is kept.
+        snapshots (List[tracemalloc.Snapshot]): Snapshots taken when profiling started and stopped.
+
+    """
+
+    files: typing.Dict[str, int] = dataclasses.field(default_factory=dict)
+    sections: typing.Dict[str, SectionMemory] = dataclasses.field(default_factory=dict)
+    snapshots: typing.List[tracemalloc.Snapshot] = dataclasses.field(default_factory=list)
+
+    def top(self, limit: int = 10) -> typing.List[SectionMemory]:
+        """Get the sections using the most memory (raw and converted), biggest first"""
+        return sorted(self.sections.values(), key=lambda s: s.raw + s.converted, reverse=True)[:limit]
+
+    def allocations(self, limit: int = 10) -> typing.List[tracemalloc.StatisticDiff]:
+        """Get the source lines which allocated the most memory while profiling, once profiling stopped"""
+        if len(self.snapshots) < 2:
+            return []
+        return self.snapshots[-1].compare_to(self.snapshots[0], "lineno")[:limit]
+
+    def summary(self, limit: int = 10) -> str:
+        """
+        Format the memory of the files and of the biggest sections as a table.
+
+        Args:
+            limit (int, optional): Number of sections to include. Defaults to 10.
+
+        Returns:
+            str: The summary.
+
+        """
+        lines = [
+            f"Read {len(self.files)} file(s), {sum(self.files.values())} bytes allocated",
+            f"Parsed {len(self.sections)} section(s), {sum(s.raw for s in self.sections.values())} bytes raw, "
+            f"{sum(s.converted for s in self.sections.values())} bytes converted",
+        ]
+        top = self.top(limit)
+        if top:
+            width = max(len("section"), *(len(s.section) for s in top))
+            lines.append(f"{'section':<{width}}  {'raw':>10}  {'converted':>10}  {'allocated':>10}  biggest field")
+            for s in top:
+                biggest = max(s.fields.items(), key=lambda item: item[1].raw + item[1].converted, default=None)
+                field = f"{biggest[0]} ({biggest[1].raw} raw, {biggest[1].converted} converted)" if biggest else ""
+                lines.append(f"{s.section:<{width}}  {s.raw:>10}  {s.converted:>10}  {s.allocated:>10}  {field}")
+        return "\n".join(lines)
+
+
+def _field_names(instance: typing.Any) -> typing.List[str]:
+    if dataclasses.is_dataclass(instance):
+        names = [field.name for field in dataclasses.fields(instance)]
+        return names + list(getattr(instance, "__dataclass_extra_fields__", ()))
+    return list(getattr(instance, "_fields", ()))
+
+
+def measure_section(parser: "ConfigParser", section_name: str, instance: typing.Any, allocated: int = 0) -> SectionMemory:
+    """
+    Measure the memory of a section and of the instance parsed from it.
+
+    Args:
+        parser (ConfigParser): The parser holding the section.
+        section_name (str): The name of the section.
+        instance (Any): The dataclass (or NamedTuple) instance parsed from the section.
+        allocated (int, optional): Memory allocated while parsing, see SectionMemory. Defaults to 0.
+
+    Returns:
+        SectionMemory: The memory of the section.
+
+    """
+    options: typing.Dict[str, typing.Any] = parser._sections.get(section_name, {})  # type: ignore[attr-defined]
+    raw = sum(sys.getsizeof(name) + sys.getsizeof(value) for name, value in options.items())
+    fields = {}
+    for name in _field_names(instance):
+        value = parser.get(section_name, name, raw=True, fallback=None)
+        fields[name] = FieldMemory(
+            raw=sys.getsizeof(value) if value is not None else 0,
+            converted=approximate_size(getattr(instance, name, None)),
+        )
+    return SectionMemory(section_name, raw, approximate_size(instance), allocated, types.MappingProxyType(fields))
+
+
+class MemoryProfiler:
+    """
+    Context manager accounting for the memory of the files read and the sections parsed by a parser.
+
+    While active, read (and read_string, read_file) and parse_section (and parse_matching) of the parser
+    are wrapped to trace their allocations with tracemalloc and to measure every parsed section.
+    Only the given parser instance is wrapped and the wrappers are removed on exit, so parsers which
+    are not profiled run without any overhead. tracemalloc is started if it is not tracing already,
+    and stopped on exit in that case.
+
+    Example:
+        with MemoryProfiler(parser) as report:
+            parser.read("app.ini")
+            parser.parse_matching("service:*", Service)
+        print(report.summary())
+
+    """
+
+    def __init__(self, parser: "ConfigParser") -> None:
+        self.parser = parser
+        self.report = MemoryReport()
+        self._started = False
+
+    def __enter__(self) -> MemoryReport:
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        self.report.snapshots.append(tracemalloc.take_snapshot())
+        self._wrap("_read", self._traced_read)
+        self._wrap("parse_section", self._traced_parse_section)
+        return self.report
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        for name in ("_read", "parse_section"):
+            self.parser.__dict__.pop(name, None)
+        self.report.snapshots.append(tracemalloc.take_snapshot())
+        if self._started:
+            tracemalloc.stop()
+
+    def _wrap(self, name: str, traced: typing.Callable[..., typing.Any]) -> None:
+        # Set on the instance, shadowing the method of the class until __exit__ removes it
+        setattr(self.parser, name, functools.partial(traced, getattr(self.parser, name)))
+
+    def _traced_read(self, method: typing.Callable[..., None], fp: typing.Iterable[str], fpname: str) -> None:
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            method(fp, fpname)
+        finally:
+            allocated = tracemalloc.get_traced_memory()[0] - before
+            self.report.files[fpname] = self.report.files.get(fpname, 0) + allocated
+
+    def _traced_parse_section(
+        self,
+        method: typing.Callable[..., typing.Any],
+        using_dataclass: typing.Any,
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> typing.Any:
+        before = tracemalloc.get_traced_memory()[0]
+        instance = method(using_dataclass, *args, **kwargs)
+        allocated = tracemalloc.get_traced_memory()[0] - before
+        section_name = args[0] if args else kwargs.get("section_name")
+        section_name = section_name or using_dataclass.__name__
+        self.report.sections[section_name] = measure_section(self.parser, section_name, instance, allocated)
+        return instance
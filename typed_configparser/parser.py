@@ -1,5 +1,12 @@
 import configparser
 import dataclasses
+import datetime
+import decimal
+import enum
+import functools
+import operator
+import os
+import pathlib
 import re
 import sys
 import types
@@ -7,16 +14,22 @@ import typing
 
 import typing_extensions
 
+from typed_configparser.constraints import Constraint
+from typed_configparser.converters import CastFunction, Converter, ConverterRegistry, GenericConverter
+from typed_configparser.diff import ConfigDiff, diff_configs
 from typed_configparser.exceptions import ParseError
+from typed_configparser.index import SectionIndex
+from typed_configparser.interning import InternPool
+from typed_configparser.reader import open_config_file, read_fast, read_lines, supports_fast_read
 
 if typing.TYPE_CHECKING:
-    from _typeshed import DataclassInstance
+    from _typeshed import DataclassInstance, StrOrBytesPath
 
 T = typing.TypeVar("T", bound="DataclassInstance")
-
-# This is a hack to make sure get_type_hints work correctly for InitVar
-# when __future__ annotations is turned on
-dataclasses.InitVar.__call__ = lambda *args: None  # type: ignore[method-assign]
+# Classes parse_section can build, dataclasses or NamedTuples
+C = typing.TypeVar("C", bound="typing.Union[DataclassInstance, typing.NamedTuple]")
+V = typing.TypeVar("V")
+E = typing.TypeVar("E", bound=enum.Enum)
 
 BOOLEAN_STATES = {
     "1": True,
@@ -36,6 +49,7 @@ _ARGS_KEY_ = "args"
 _REGEX_ = r",(?![^\[\(\{]*[\]\)\}])"
 
 LIST_TYPE = (list, typing.List)
+LITERAL_TYPE = (typing.Literal, typing_extensions.Literal)
 DICT_TYPE = (dict, typing.Dict)
 TUPLE_TYPE = (tuple, typing.Tuple)
 
@@ -47,13 +61,18 @@ else:  # pragma: no cover
     NONE_TYPE = (type(None),)
 
 
+def _field_names(self: T) -> typing.List[str]:
+    # Fields of the dataclass followed by the extra fields stored on this instance by parse_section
+    return [field.name for field in dataclasses.fields(self)] + list(getattr(self, "__dataclass_extra_fields__", ()))
+
+
 def _CUSTOM_REPR_METHOD(self: T) -> str:
-    fields_str = ", ".join(f"{field.name}={getattr(self, field.name)}" for field in self.__dataclass_fields__.values())
+    fields_str = ", ".join(f"{name}={getattr(self, name)}" for name in _field_names(self))
     return f"{self.__class__.__name__}({fields_str})"
 
 
 def _CUSTOM_STR_METHOD(self: T) -> str:
-    fields_str = ", ".join(f"{field.name}={getattr(self, field.name)}" for field in self.__dataclass_fields__.values())
+    fields_str = ", ".join(f"{name}={getattr(self, name)}" for name in _field_names(self))
     return f"{self.__class__.__name__}({fields_str})"
 
 
@@ -72,12 +91,90 @@ def get_types(typ: typing.Type[typing.Any]) -> typing.Any:
     args = typing_extensions.get_args(typ)
     if origin is None:
         return typ
+    if origin is typing_extensions.Annotated:
+        # Keep only constraints from the metadata, so they are looked up once per type
+        return {
+            _ORIGIN_KEY_: origin,
+            _ARGS_KEY_: [get_types(args[0]), *(arg for arg in args[1:] if isinstance(arg, Constraint))],
+        }
     result = {_ORIGIN_KEY_: origin, _ARGS_KEY_: []}
     for arg in args:
         result[_ARGS_KEY_].append(get_types(arg))
     return result
 
 
+def strip_annotated(typs: typing.Any) -> typing.Any:
+    """Get the annotated type from types of an Annotated type, as returned by get_types"""
+    while isinstance(typs, DICT_TYPE) and typs[_ORIGIN_KEY_] is typing_extensions.Annotated:
+        typs = typs[_ARGS_KEY_][0]
+    return typs
+
+
+def drop_metadata(typ: typing.Any) -> typing.Any:
+    """
+    Drop the Annotated metadata which is not a Constraint from a type (and the types nested in it)
+    when it makes the type unhashable, e.g. Annotated[int, {"doc": "..."}]. Such metadata is not
+    used for conversion, and types are used as keys of caches. Hashable types are returned as is.
+    """
+    try:
+        hash(typ)
+        return typ
+    except TypeError:
+        pass
+    args = typing_extensions.get_args(typ)
+    if typing_extensions.get_origin(typ) is typing_extensions.Annotated:
+        constraints = tuple(arg for arg in args[1:] if isinstance(arg, Constraint))
+        inner = drop_metadata(args[0])
+        return typing_extensions.Annotated[(inner, *constraints)] if constraints else inner
+    args = tuple(drop_metadata(arg) for arg in args)
+    if sys.version_info >= (3, 10) and isinstance(typ, types.UnionType):  # pragma: no cover
+        return functools.reduce(operator.or_, args)
+    if sys.version_info >= (3, 9) and isinstance(typ, types.GenericAlias):  # pragma: no cover
+        return types.GenericAlias(typ.__origin__, args)  # type: ignore[arg-type]
+    return typ.copy_with(args)
+
+
+@functools.lru_cache(maxsize=1024)
+def resolve_type_hints(typ: typing.Type[typing.Any]) -> typing.Dict[str, typing.Any]:
+    """
+    Get type hints of a class. Type hints are resolved only once per class.
+    Annotated metadata is kept, except for unhashable metadata which is not a constraint (see drop_metadata).
+
+    Args:
+        typ (Type): The class for which to retrieve type hints.
+
+    Returns:
+        Dict[str, Any]: A dictionary of attribute names and their types.
+
+    """
+    try:
+        hints = typing_extensions.get_type_hints(typ, include_extras=True)
+    except TypeError:
+        # Before Python 3.11 string annotations (e.g. with __future__ annotations) must evaluate
+        # to a type, which InitVar[...] is not
+        hints = _resolve_annotations(typ)
+    return {name: drop_metadata(hint) for name, hint in hints.items()}
+
+
+def _resolve_annotations(typ: typing.Type[typing.Any]) -> typing.Dict[str, typing.Any]:
+    """Resolve the annotations of a class one at a time, evaluating those which are not types as is"""
+    hints: typing.Dict[str, typing.Any] = {}
+    for base in reversed(typ.__mro__):
+        module = sys.modules.get(base.__module__)
+        globalns = getattr(module, "__dict__", {})
+        localns = dict(vars(base))
+        for name, annotation in base.__dict__.get("__annotations__", {}).items():
+
+            def holder() -> None: ...
+
+            holder.__annotations__ = {name: annotation}
+            try:
+                hints[name] = typing_extensions.get_type_hints(holder, globalns, localns, include_extras=True)[name]
+            except TypeError:
+                hints[name] = eval(annotation, globalns, localns) if isinstance(annotation, str) else annotation
+    return hints
+
+
 def cast_bool(section: str, option: str, value: str) -> bool:
     if value.lower() not in BOOLEAN_STATES:
         raise ParseError(f"Cannot cast value '{value}' to 'boolean'", section, option=option)
@@ -122,88 +219,352 @@ def cast_str(section: str, option: str, value: str) -> typing.Any:
         raise ParseError(f"Cannot cast value '{value}' to 'str'", section, option=option)
 
 
-def get_name(args: typing.List[type]) -> str:
-    return "|".join([getattr(arg, "__name__", repr(arg)) for arg in args])
+def get_name(args: typing.List[typing.Any]) -> str:
+    return "|".join([get_type_name(arg) for arg in args])
 
 
-def cast_value_wrapper(section: str, option: str, value: str, target_type: typing.Any) -> typing.Any:
-    def cast_value(value: str, target_type: typing.Any) -> typing.Any:
-        """
-        Cast a string value to the specified target type.
-        Types are traversed recursively to match the first matching type.
+def get_type_name(typ: typing.Any) -> str:
+    """Get a readable name of a type, or of the types information of a type as returned by get_types"""
+    if not isinstance(typ, DICT_TYPE):
+        return "..." if typ is Ellipsis else getattr(typ, "__name__", repr(typ))
+    origin, args = typ[_ORIGIN_KEY_], typ[_ARGS_KEY_]
+    if origin in UNION_TYPE:
+        return get_name(args)
+    if origin is typing_extensions.Annotated:
+        return f"Annotated[{', '.join([get_type_name(args[0]), *map(repr, args[1:])])}]"
+    if origin in LITERAL_TYPE:
+        return f"Literal[{', '.join(map(repr, args))}]"
+    return f"{get_type_name(origin)}[{', '.join(map(get_type_name, args))}]"
 
-        Lists are special. For list, the string should be separated by LIST_DELIMITED
-        which is defaulted to a ",".
 
-        Args:
-            value (str): The string value to be cast.
-            target_type (Any): The target type to which the value should be cast.
+class _ConstraintError(ParseError):
+    """A value was cast to its type but a constraint of an Annotated type rejected it"""
 
-        Returns:
-            Any: The casted value of the specified type.
 
-        Raises:
-            ParseError: If the value cannot be cast to any of the given types.
+def cast_union(section: str, option: str, value: str, args: typing.List[typing.Any], cast: CastFunction) -> typing.Any:
+    constraint_error = None
+    for arg in args:
+        try:
+            return cast(value, arg)
+        except _ConstraintError as e:
+            constraint_error = constraint_error or e
+        except Exception:
+            continue
+
+    # The reason a constraint rejected the value is more useful than the list of types
+    if constraint_error is not None:
+        raise constraint_error
+    raise ParseError(
+        f"Cannot cast value '{value}' to '({get_name(args)})' type",
+        section,
+        option=option,
+    )
+
+
+def cast_list(section: str, option: str, value: str, args: typing.List[typing.Any], cast: CastFunction) -> typing.Any:
+    if is_list(value):
+        if not strip(value, "[", "]").strip():
+            return []
+        values = re.split(_REGEX_, strip(value, "[", "]"))
+        return [cast(item.strip(), args) for item in values]
+    else:
+        raise ParseError(f"Cannot cast value '{value}' to 'list'", section, option=option)
 
-        """
-        if isinstance(target_type, DICT_TYPE):
-            origin = target_type[_ORIGIN_KEY_]
-            args = target_type[_ARGS_KEY_]
-            if origin in UNION_TYPE:
-                for arg in args:
-                    try:
-                        return cast_value(value, arg)
-                    except Exception:
-                        continue
 
-                raise ParseError(
-                    f"Cannot cast value '{value}' to '({get_name(args)})' type",
-                    section,
-                    option=option,
-                )
-            elif origin in LIST_TYPE:
-                if is_list(value):
-                    values = re.split(_REGEX_, strip(value, "[", "]"))
-                    return [cast_value(item.strip(), args) for item in values]
-                else:
-                    raise ParseError(f"Cannot cast value '{value}' to 'list'", section, option=option)
-            elif origin in TUPLE_TYPE:
-                if is_tuple(value):
-                    values = re.split(_REGEX_, strip(value, "(", ")"))
-                    return tuple([cast_value(item.strip(), arg) for item, arg in zip(values, args)])
-                else:
-                    raise ParseError(f"Cannot cast value '{value}' to 'tuple'", section, option=option)
-            elif origin in DICT_TYPE:
-                if is_dict(value):
-                    values = re.split(_REGEX_, strip(value, "{", "}"))
-                    return {
-                        cast_value(k.strip(), args[0]): cast_value(v.strip(), args[1])
-                        for k, _, v in (val.partition(":") for val in values)
-                    }
-                else:
-                    raise ParseError(f"Cannot cast value '{value}' to 'dict'", section, option=option)
-        elif isinstance(target_type, LIST_TYPE):
-            for arg in target_type:
-                return cast_value(value, arg)
-        elif target_type == int:
-            return cast_int(section, option, value)
-        elif target_type == float:
-            return cast_float(section, option, value)
-        elif target_type == str:
-            return cast_str(section, option, value)
-        elif target_type == bool:
-            return cast_bool(section, option, value)
-        elif target_type in NONE_TYPE:
-            return cast_none(section, option, value)
+def cast_tuple(section: str, option: str, value: str, args: typing.List[typing.Any], cast: CastFunction) -> typing.Any:
+    if is_tuple(value):
+        if not strip(value, "(", ")").strip():
+            return ()
+        values = re.split(_REGEX_, strip(value, "(", ")"))
+        return tuple([cast(item.strip(), arg) for item, arg in zip(values, args)])
+    else:
+        raise ParseError(f"Cannot cast value '{value}' to 'tuple'", section, option=option)
+
+
+def cast_dict(section: str, option: str, value: str, args: typing.List[typing.Any], cast: CastFunction) -> typing.Any:
+    if is_empty_dict(value):
+        return {}
+    if is_dict(value):
+        values = re.split(_REGEX_, strip(value, "{", "}"))
+        return {cast(k.strip(), args[0]): cast(v.strip(), args[1]) for k, _, v in (val.partition(":") for val in values)}
+    else:
+        raise ParseError(f"Cannot cast value '{value}' to 'dict'", section, option=option)
+
+
+def cast_annotated(
+    section: str, option: str, value: str, args: typing.List[typing.Any], cast: CastFunction
+) -> typing.Any:
+    result = cast(value, args[0])
+    # None is the value of an unset Optional, there is nothing to check
+    if result is None:
+        return result
+    for constraint in args[1:]:
+        try:
+            constraint.check(result)
+        except (ValueError, TypeError) as e:
+            raise _ConstraintError(str(e), section, option=option)
+    return result
+
+
+def make_converter(target_type: typing.Any, func: typing.Callable[[str], typing.Any]) -> Converter:
+    """
+    Wrap a function converting a raw value into a Converter which raises ParseError
+    with section and option if the function fails.
+
+    Args:
+        target_type (Any): The type func converts values to, used in the error message.
+        func (Callable[[str], Any]): The function converting a raw value.
+
+    Returns:
+        Converter: The converter.
+
+    """
+    name = getattr(target_type, "__name__", repr(target_type))
+
+    def converter(section: str, option: str, value: str) -> typing.Any:
+        try:
+            return func(value)
+        except ParseError:
+            raise
+        except Exception:
+            raise ParseError(f"Cannot cast value '{value}' to '{name}'", section, option=option)
+
+    return converter
+
+
+_NUMBER_ = r"(?:\d+(?:\.\d*)?|\.\d+)"
+_DURATION_UNITS_ = (
+    ("weeks", r"w(?:eeks?)?"),
+    ("days", r"d(?:ays?)?"),
+    ("hours", r"h(?:ours?)?"),
+    ("minutes", r"m(?:in(?:utes?)?)?"),
+    ("seconds", r"s(?:ec(?:onds?)?)?"),
+    ("milliseconds", r"ms"),
+    ("microseconds", r"us"),
+)
+# Durations like "1h30m", "2 days", "1.5h", "500ms" or "30" (seconds), with an optional sign
+_DURATION_REGEX_ = re.compile(
+    r"\s*(?P<sign>[-+])?\s*(?:"
+    + r"\s*".join(f"(?:(?P<{name}>{_NUMBER_})\\s*{unit}(?![a-z]))?" for name, unit in _DURATION_UNITS_)
+    + rf"|(?P<bare>{_NUMBER_}))\s*",
+    re.IGNORECASE,
+)
+# Durations like "1:30:00" or "0:00:01.5" (hours may exceed 24)
+_CLOCK_REGEX_ = re.compile(r"\s*(?P<sign>[-+])?(?P<hours>\d+):(?P<minutes>[0-5]\d):(?P<seconds>[0-5]\d(?:\.\d+)?)\s*")
+
+
+def parse_duration(value: str) -> datetime.timedelta:
+    """
+    Parse a duration e.g. "1h30m", "2 days", "1.5h", "500ms", "1:30:00" or "30" (seconds).
+
+    Units are w (weeks), d (days), h (hours), m (minutes), s (seconds), ms and us, in this order,
+    and can be spelled out ("2 hours 5 minutes").
+
+    Raises:
+        ValueError: If the value is not a valid duration.
+
+    """
+    match = _DURATION_REGEX_.fullmatch(value) or _CLOCK_REGEX_.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid duration '{value}'")
+    parts = {name: float(number) for name, number in match.groupdict().items() if number and name != "sign"}
+    if not parts:
+        raise ValueError(f"Invalid duration '{value}'")
+    if "bare" in parts:
+        parts["seconds"] = parts.pop("bare")
+    duration = datetime.timedelta(**parts)
+    return -duration if match.group("sign") == "-" else duration
+
+
+def format_duration(value: datetime.timedelta) -> str:
+    """Format a duration as parsed by parse_duration, e.g. "1d2h30m15.5s" """
+    if value < datetime.timedelta(0):
+        return "-" + format_duration(-value)
+    minutes, seconds = divmod(value.seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    result = "".join(f"{n}{unit}" for n, unit in ((value.days, "d"), (hours, "h"), (minutes, "m")) if n)
+    if value.microseconds:
+        return result + f"{seconds}.{value.microseconds:06d}".rstrip("0") + "s"
+    return result + f"{seconds}s" if seconds or not result else result
+
+
+def _value_lookups(
+    values: typing.Iterable[typing.Any], case_sensitive: bool
+) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, typing.Any]]:
+    """
+    Build the dicts used to look up a value (or Enum member) from its string form: one for the
+    exact string and one for the lower case string. Booleans and None are always looked up
+    ignoring case, like cast_bool and cast_none do. The first value wins if string forms collide.
+    """
+    exact: typing.Dict[str, typing.Any] = {}
+    folded: typing.Dict[str, typing.Any] = {}
+    for value in values:
+        if value is None:
+            for key in NONE_VALUES:
+                folded.setdefault(key, value)
+        elif isinstance(value, bool):
+            for key, state in BOOLEAN_STATES.items():
+                if state is value:
+                    folded.setdefault(key, value)
         else:
-            return cast_any(section, option, value, target_type)
+            keys = [value.name, str(value.value)] if isinstance(value, enum.Enum) else [str(value)]
+            for key in keys:
+                exact.setdefault(key, value)
+                if not case_sensitive:
+                    folded.setdefault(key.lower(), value)
+    return exact, folded
+
+
+def enum_converter(enum_class: typing.Type[E], case_sensitive: bool = True) -> typing.Callable[[str], E]:
+    """
+    Get a function converting the name or the value of a member of an Enum to the member, using a
+    dict built once. This is the converter used for Enum types by default, register it with
+    ConfigParser.register_converter for case insensitive lookups.
+
+    Args:
+        enum_class (Type[E]): The Enum type.
+        case_sensitive (bool, optional): Match names and values exactly. Defaults to True.
+
+    Returns:
+        Callable[[str], E]: The converter, raising KeyError for unknown values.
+
+    """
+    exact, folded = _value_lookups(enum_class, case_sensitive)
+
+    def convert(value: str) -> E:
+        try:
+            return exact[value]  # type: ignore[no-any-return]
+        except KeyError:
+            return folded[value.lower()]  # type: ignore[no-any-return]
+
+    return convert
+
+
+class _LiteralConverter:
+    """Converter of Literal types, see literal_converter"""
+
+    def __init__(self, case_sensitive: bool) -> None:
+        self.case_sensitive = case_sensitive
+        # Keyed by type and value of the arguments, as Literal[1] and Literal[True] have equal arguments
+        self._lookups: typing.Dict[typing.Tuple[typing.Any, ...], typing.Tuple[typing.Dict[str, typing.Any], ...]] = {}
+
+    def copy(self) -> "_LiteralConverter":
+        """Get a converter with lookups of its own, used by ConverterRegistry.copy"""
+        return _LiteralConverter(self.case_sensitive)
+
+    def __call__(
+        self, section: str, option: str, value: str, args: typing.List[typing.Any], cast: CastFunction
+    ) -> typing.Any:
+        key = tuple((type(arg), arg) for arg in args)
+        try:
+            exact, folded = self._lookups[key]
+        except KeyError:
+            exact, folded = self._lookups[key] = _value_lookups(args, self.case_sensitive)
+        try:
+            return exact[value]
+        except KeyError:
+            pass
+        try:
+            return folded[value.lower()]
+        except KeyError:
+            raise ParseError(
+                f"Cannot cast value '{value}' to 'Literal[{', '.join(repr(arg) for arg in args)}]'",
+                section,
+                option=option,
+            )
+
+
+def literal_converter(case_sensitive: bool = True) -> GenericConverter:
+    """
+    Get the converter of Literal types, which looks up values in dicts built once per Literal type.
+    This is the converter used for Literal types by default, register it with
+    ConfigParser.type_converters.register_generic for case insensitive lookups.
+
+    Args:
+        case_sensitive (bool, optional): Match string forms of values exactly. Defaults to True.
+
+    Returns:
+        GenericConverter: The converter. Every copy of a registry holding it gets its own lookup dicts.
+
+    """
+    return _LiteralConverter(case_sensitive)
+
+
+DEFAULT_CONVERTERS = ConverterRegistry(
+    {
+        int: cast_int,
+        float: cast_float,
+        str: cast_str,
+        bool: cast_bool,
+        **{N_: cast_none for N_ in NONE_TYPE},
+        datetime.datetime: make_converter(datetime.datetime, datetime.datetime.fromisoformat),
+        datetime.date: make_converter(datetime.date, datetime.date.fromisoformat),
+        datetime.time: make_converter(datetime.time, datetime.time.fromisoformat),
+        datetime.timedelta: make_converter(datetime.timedelta, parse_duration),
+        decimal.Decimal: make_converter(decimal.Decimal, decimal.Decimal),
+        pathlib.Path: make_converter(pathlib.Path, pathlib.Path),
+    },
+    {
+        **{U_: cast_union for U_ in UNION_TYPE},
+        **{L_: cast_list for L_ in LIST_TYPE},
+        **{T_: cast_tuple for T_ in TUPLE_TYPE},
+        **{D_: cast_dict for D_ in DICT_TYPE},
+        **{L_: literal_converter() for L_ in LITERAL_TYPE},
+        typing_extensions.Annotated: cast_annotated,
+    },
+    factories={enum.Enum: lambda typ: make_converter(typ, enum_converter(typ))},
+)
+
+
+def cast_value_wrapper(
+    section: str,
+    option: str,
+    value: str,
+    target_type: typing.Any,
+    registry: ConverterRegistry = DEFAULT_CONVERTERS,
+) -> typing.Any:
+    """
+    Cast a string value to the specified target type.
+    Types are traversed recursively to match the first matching type.
+
+    Lists are special. For list, the string should be separated by LIST_DELIMITED
+    which is defaulted to a ",".
+
+    Converters are looked up in the registry, types without a converter are
+    cast by calling the type with the value.
+
+    Args:
+        section (str): The name of the configuration section, used in errors.
+        option (str): The name of the configuration option, used in errors.
+        value (str): The string value to be cast.
+        target_type (Any): The target type to which the value should be cast, as returned by get_types.
+        registry (ConverterRegistry, optional): The converters. Defaults to DEFAULT_CONVERTERS.
+
+    Returns:
+        Any: The casted value of the specified type.
+
+    Raises:
+        ParseError: If the value cannot be cast to any of the given types.
 
-    return cast_value(value, target_type)
+    """
+    if isinstance(target_type, DICT_TYPE):
+        generic_converter = registry.lookup_generic(target_type[_ORIGIN_KEY_])
+        if generic_converter is not None:
+            cast = functools.partial(cast_value_wrapper, section, option, registry=registry)
+            return generic_converter(section, option, value, target_type[_ARGS_KEY_], cast)
+    elif isinstance(target_type, LIST_TYPE):
+        for arg in target_type:
+            return cast_value_wrapper(section, option, value, arg, registry)
+    else:
+        converter = registry.lookup(target_type)
+        if converter is not None:
+            return converter(section, option, value)
+        return cast_any(section, option, value, target_type)
 
 
 def is_field_optional(typ: typing.Type[T]) -> bool:
     """Check whether type contains any None type variable"""
-    typs = get_types(typ)
+    typs = strip_annotated(get_types(typ))
     if isinstance(typs, DICT_TYPE):
         return any(N_ in typs.get(_ARGS_KEY_, ()) for N_ in NONE_TYPE)
     else:
@@ -235,6 +596,10 @@ def is_dict(value: str) -> bool:
     return False
 
 
+def is_empty_dict(value: str) -> bool:
+    return value.startswith("{") and value.endswith("}") and not value[1:-1].strip()
+
+
 def strip(value: str, first: str, last: str) -> str:
     """Strip single matching first and last character only if both match"""
     if value.startswith(first) and value.endswith(last):
@@ -242,27 +607,358 @@ def strip(value: str, first: str, last: str) -> str:
     return value  # pragma: no cover
 
 
-def generate_field(key: str, default: typing.Optional[str] = None) -> typing.Any:
-    """Get a new empty field with just the name attribute"""
-    f = dataclasses.field()
-    f.name = key
-    if default:
-        f.default = default
-    return f
-
-
-def is_dataclass(typ: typing.Type[T]) -> bool:
+def is_dataclass(typ: typing.Any) -> bool:
     """This is added for typing"""
     return dataclasses.is_dataclass(typ)
 
 
+def is_namedtuple(typ: typing.Any) -> bool:
+    """Check whether a type is a typing.NamedTuple class"""
+    return (
+        isinstance(typ, type) and issubclass(typ, tuple) and hasattr(typ, "_fields") and hasattr(typ, "__annotations__")
+    )
+
+
+def _constant(value: typing.Any) -> typing.Callable[[], typing.Any]:
+    return lambda: value
+
+
+Formatter = typing.Callable[[typing.Any], str]
+
+
+def format_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def format_none(value: None) -> str:
+    return "none"
+
+
+def format_float(value: float) -> str:
+    # repr gives the shortest string which float() turns back into the same value
+    return repr(value)
+
+
+def format_enum(value: enum.Enum) -> str:
+    return value.name
+
+
+def format_literal(value: typing.Any) -> str:
+    if value is None:
+        return format_none(value)
+    elif isinstance(value, bool):
+        return format_bool(value)
+    elif isinstance(value, enum.Enum):
+        return format_enum(value)
+    return str(value)
+
+
+def is_instance_of(target_type: typing.Any) -> typing.Callable[[typing.Any], bool]:
+    """
+    Get a function which checks whether a value belongs to the specified target type.
+    Used to pick the matching member of a Union while formatting a value.
+
+    Args:
+        target_type (Any): The target type as returned by get_types.
+
+    Returns:
+        Callable[[Any], bool]: A function returning True if the value belongs to the target type.
+
+    """
+    target_type = strip_annotated(target_type)
+    if isinstance(target_type, DICT_TYPE):
+        origin = target_type[_ORIGIN_KEY_]
+        if origin in UNION_TYPE:
+            checks = [is_instance_of(arg) for arg in target_type[_ARGS_KEY_]]
+            return lambda value: any(check(value) for check in checks)
+        if origin in LITERAL_TYPE:
+            values = target_type[_ARGS_KEY_]
+            return lambda value: any(type(value) is type(v) and value == v for v in values)
+        if isinstance(origin, type):
+            return lambda value: isinstance(value, origin)
+        return lambda value: True  # pragma: no cover
+    elif target_type in NONE_TYPE:
+        return lambda value: value is None
+    elif target_type == int:
+        return lambda value: isinstance(value, int) and not isinstance(value, bool)
+    elif isinstance(target_type, type):
+        return lambda value: isinstance(value, target_type)
+    return lambda value: True  # pragma: no cover
+
+
+def compile_formatter(target_type: typing.Any) -> Formatter:
+    """
+    Build a function which formats a value as a string which cast_value casts back to the same value.
+    This is the inverse of cast_value and follows the same rules for lists, tuples, dicts, bool and None.
+
+    Args:
+        target_type (Any): The target type as returned by get_types.
+
+    Returns:
+        Formatter: A function formatting a value of the target type as a string.
+
+    """
+    target_type = strip_annotated(target_type)
+    if isinstance(target_type, DICT_TYPE):
+        origin = target_type[_ORIGIN_KEY_]
+        args = target_type[_ARGS_KEY_]
+        if origin in UNION_TYPE:
+            candidates = [(is_instance_of(arg), compile_formatter(arg)) for arg in args]
+
+            def format_union(value: typing.Any) -> str:
+                for check, formatter in candidates:
+                    if check(value):
+                        return formatter(value)
+                return str(value)
+
+            return format_union
+        elif origin in LIST_TYPE:
+            item_formatter = compile_formatter(args[0]) if args else str
+            return lambda value: "[" + ", ".join([item_formatter(item) for item in value]) + "]"
+        elif origin in TUPLE_TYPE:
+            item_formatters = [compile_formatter(arg) for arg in args]
+            return lambda value: "(" + ", ".join([f(item) for f, item in zip(item_formatters, value)]) + ")"
+        elif origin in DICT_TYPE:
+            key_formatter = compile_formatter(args[0]) if args else str
+            value_formatter = compile_formatter(args[1]) if args else str
+            return lambda value: (
+                "{" + ", ".join([f"{key_formatter(k)}: {value_formatter(v)}" for k, v in value.items()]) + "}"
+            )
+        elif origin in LITERAL_TYPE:
+            return format_literal
+        return str  # pragma: no cover
+    elif target_type == bool:
+        return format_bool
+    elif target_type == float:
+        return format_float
+    elif target_type in NONE_TYPE:
+        return format_none
+    elif target_type in (datetime.datetime, datetime.date, datetime.time):
+        return lambda value: value.isoformat()
+    elif target_type == datetime.timedelta:
+        return format_duration
+    elif isinstance(target_type, type) and issubclass(target_type, enum.Enum):
+        return format_enum
+    else:
+        return str
+
+
+# Precompiled writer for a dataclass: (option name, formatter, omit value if None) for every field
+SectionWriter = typing.Tuple[typing.Tuple[str, Formatter, bool], ...]
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_writer(using_dataclass: typing.Type[T]) -> SectionWriter:
+    """
+    Build the writer for a dataclass once, so that serializing many instances of the same
+    dataclass does not resolve type hints or walk the types again.
+
+    Fields with init flag set to False are not written as they cannot be supplied to the dataclass.
+    Optional fields without a default (or with None as default) are omitted when their value is None
+    since parse_section sets them to None when they are not found.
+
+    Args:
+        using_dataclass (Type[T]): The dataclass type to build the writer for.
+
+    Returns:
+        SectionWriter: The precompiled writer for the dataclass.
+
+    """
+    type_hints = resolve_type_hints(using_dataclass)
+    writer = []
+    for field in dataclasses.fields(using_dataclass):
+        if field.init is False:
+            continue
+        field_type = type_hints[field.name]
+        omit_none = is_field_optional(field_type) and (not is_field_default(field) or field.default is None)
+        writer.append((field.name, compile_formatter(get_types(field_type)), omit_none))
+    return tuple(writer)
+
+
+@dataclasses.dataclass(frozen=True)
+class ConstructionPlan:
+    """
+    How parse_section builds instances of a dataclass, see compile_construction_plan.
+
+    Attributes:
+        fields (Dict[str, Tuple[int, Any]]): Field name to the index of its slot (-1 for fields passed
+            as keyword with their default as fallback) and its type hint.
+        slots (Tuple[Any, ...]): Initial slots of the fields without a default. Optional fields start
+            as None and other fields as dataclasses.MISSING until a value is found.
+        slot_names (Tuple[str, ...]): Names of the fields of the slots.
+        positional (int): Number of slots passed as positional arguments, the remaining slots are
+            keyword-only fields passed as keyword arguments.
+        init_vars (Tuple[Tuple[str, int], ...]): Name and index of the slot (-1 for keyword) of
+            the InitVars of the dataclass.
+        record_fields (Tuple[Tuple[str, int, Optional[Callable[[], Any]]], ...]): Name, index of the slot
+            (-1 for keyword) and default factory of the fields of a record, see parse_records.
+        not_init (FrozenSet[str]): Names of the fields with init flag set to False. They are not arguments
+            of __init__, so their options are ignored.
+
+    """
+
+    fields: typing.Dict[str, typing.Tuple[int, typing.Any]]
+    slots: typing.Tuple[typing.Any, ...]
+    slot_names: typing.Tuple[str, ...]
+    positional: int
+    init_vars: typing.Tuple[typing.Tuple[str, int], ...]
+    record_fields: typing.Tuple[typing.Tuple[str, int, typing.Optional[typing.Callable[[], typing.Any]]], ...]
+    not_init: typing.FrozenSet[str] = frozenset()
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_construction_plan(using_dataclass: typing.Any) -> ConstructionPlan:
+    """
+    Build the construction plan of a dataclass once, so that parsing many sections into the same
+    dataclass does not look at its fields and type hints again for every section.
+
+    Fields and InitVars without a default get a slot, in the order of the arguments of __init__,
+    passed positionally (or as keyword for keyword-only fields). Fields with a default are passed as
+    keyword only when found in the section. Fields with init flag set to False are not passed at all.
+    NamedTuple classes are supported as well, they have no InitVars nor keyword-only fields.
+
+    Args:
+        using_dataclass (Any): The dataclass (or NamedTuple) type to build the plan for.
+
+    Returns:
+        ConstructionPlan: The construction plan of the dataclass.
+
+    """
+    type_hints = resolve_type_hints(using_dataclass)
+    if is_namedtuple(using_dataclass):
+        field_defaults = using_dataclass._field_defaults
+        names = [name for name in using_dataclass._fields if name not in field_defaults]
+        tuple_fields = tuple(
+            (name, -1, _constant(field_defaults[name])) if name in field_defaults else (name, names.index(name), None)
+            for name in using_dataclass._fields
+        )
+        return ConstructionPlan(
+            fields={name: (index, type_hints[name]) for name, index, _ in tuple_fields},
+            slots=tuple(None if is_field_optional(type_hints[name]) else dataclasses.MISSING for name in names),
+            slot_names=tuple(names),
+            positional=len(names),
+            init_vars=(),
+            record_fields=tuple_fields,
+        )
+
+    positional: typing.List[dataclasses.Field[typing.Any]] = []
+    keyword: typing.List[dataclasses.Field[typing.Any]] = []
+    defaults: typing.List[dataclasses.Field[typing.Any]] = []
+    not_init = []
+    # Fields and InitVars in declared order, which is the order of the arguments of __init__
+    # except for keyword-only ones
+    for field in using_dataclass.__dataclass_fields__.values():
+        if field._field_type not in (dataclasses._FIELD, dataclasses._FIELD_INITVAR):  # type: ignore[attr-defined]
+            continue
+        if field.init is False:
+            not_init.append(field.name)
+        elif is_field_default(field):
+            defaults.append(field)
+        elif getattr(field, "kw_only", False) is True:
+            keyword.append(field)
+        else:
+            positional.append(field)
+
+    slot_fields = positional + keyword
+    fields: typing.Dict[str, typing.Tuple[int, typing.Any]] = {}
+    slots: typing.List[typing.Any] = []
+    init_vars = []
+    for index, field in [*enumerate(slot_fields), *((-1, f) for f in defaults)]:
+        is_init_var = field._field_type is dataclasses._FIELD_INITVAR  # type: ignore[attr-defined]
+        if is_init_var:
+            init_vars.append((field.name, index))
+        else:
+            fields[field.name] = (index, type_hints[field.name])
+        if index >= 0:
+            slots.append(None if is_init_var or is_field_optional(type_hints[field.name]) else dataclasses.MISSING)
+
+    # Fields of a record are the fields which can be given to __init__, in declared order
+    record_fields: typing.List[typing.Tuple[str, int, typing.Optional[typing.Callable[[], typing.Any]]]] = []
+    for field in dataclasses.fields(using_dataclass):
+        if field.init is False:
+            continue
+        index = fields[field.name][0]
+        if index >= 0:
+            record_fields.append((field.name, index, None))
+        elif field.default_factory is not dataclasses.MISSING:
+            record_fields.append((field.name, index, field.default_factory))
+        else:
+            record_fields.append((field.name, index, _constant(field.default)))
+    return ConstructionPlan(
+        fields=fields,
+        slots=tuple(slots),
+        slot_names=tuple(f.name for f in slot_fields),
+        positional=len(positional),
+        init_vars=tuple(init_vars),
+        record_fields=tuple(record_fields),
+        not_init=frozenset(not_init),
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class Records:
+    """
+    Sections parsed into plain tuples by ConfigParser.parse_records, a compact alternative to
+    dataclass instances when parsing many sections of the same schema.
+
+    Attributes:
+        fields (Mapping[str, int]): Field name to its position in the rows, shared by all rows.
+        sections (List[str]): Section names, in the order of the rows.
+        rows (List[Tuple[Any, ...]]): Values of the fields of every section.
+
+    """
+
+    fields: typing.Mapping[str, int]
+    sections: typing.List[str]
+    rows: typing.List[typing.Tuple[typing.Any, ...]]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def column(self, field: str) -> typing.List[typing.Any]:
+        """Get the values of a field for all sections, in the order of the rows"""
+        index = self.fields[field]
+        return [row[index] for row in self.rows]
+
+
+def format_section(instance: "DataclassInstance") -> typing.List[typing.Tuple[str, str]]:
+    """
+    Format all fields of a dataclass instance as configuration options.
+
+    Args:
+        instance (DataclassInstance): The dataclass instance to format.
+
+    Returns:
+        List[Tuple[str, str]]: List of option name and formatted value pairs.
+
+    """
+    options = []
+    for name, formatter, omit_none in compile_writer(type(instance)):
+        value = getattr(instance, name)
+        if value is None and omit_none:
+            continue
+        options.append((name, formatter(value)))
+    # Extra fields are always stored as string
+    for name in getattr(instance, "__dataclass_extra_fields__", ()):
+        if name in instance.__dict__:
+            options.append((name, str(instance.__dict__[name])))
+    return options
+
+
 class ConfigParser(configparser.ConfigParser):
     """
     Extended configparser with support for typed configuration using dataclasses.
 
+    A parser holds no state shared with other parsers, so parsers used by different threads (one per
+    thread) don't need any locking.
+
     Attributes:
         __config_class_mapper__ (Dict[str, Any]): A mapping of section names to corresponding
-            dataclass types.
+            dataclass types, per parser.
+        intern_pool (Optional[InternPool]): Pool of converted values shared across sections,
+            None unless intern_values is set.
+        type_converters (ConverterRegistry): Converters used to cast values, a copy of the library
+            defaults per instance. Use register_converter to add converters.
 
     Methods:
         _get_type(self, section: str, option: str) -> Any:
@@ -273,7 +969,204 @@ class ConfigParser(configparser.ConfigParser):
 
     """
 
-    __config_class_mapper__: typing.Dict[str, typing.Any] = {}
+    def __init__(
+        self,
+        *args: typing.Any,
+        intern_values: bool = False,
+        reader: typing.Literal["stdlib", "fast"] = "stdlib",
+        **kwargs: typing.Any,
+    ) -> None:
+        """
+        Args:
+            intern_values (bool, optional): Share equal converted strings and tuples across all sections
+                parsed by parse_section to reduce memory of large configurations. Statistics are available
+                with intern_pool.report(). Defaults to False.
+            reader (Literal["stdlib", "fast"], optional): Engine used to read configuration files. "fast"
+                tokenizes files in a single pass with string methods instead of regular expressions and
+                produces the same result as "stdlib". Parsers with customized regular expressions are
+                always read with "stdlib". Defaults to "stdlib".
+
+        All other arguments are passed to configparser.ConfigParser.
+        """
+        # Incremented on every modification, used to invalidate memoized values of Section views.
+        # Must be set before calling super class init as it may already add sections & options
+        self._version = 0
+        self._typed_converters: typing.Dict[typing.Any, Converter] = {}
+        self.__config_class_mapper__: typing.Dict[str, typing.Any] = {}
+        # Front of the module level caches, looked up without touching the caches shared by all parsers
+        self._type_hints: typing.Dict[typing.Any, typing.Dict[str, typing.Any]] = {}
+        self._plans: typing.Dict[typing.Any, ConstructionPlan] = {}
+        self.intern_pool = InternPool() if intern_values else None
+        self._reader = reader
+        self._section_index = SectionIndex()
+        self.type_converters = DEFAULT_CONVERTERS.copy()
+        super().__init__(*args, **kwargs)
+
+    def _modified(self) -> None:
+        self._version += 1
+
+    def add_section(self, section: str) -> None:
+        super().add_section(section)
+        self._section_index.add(section)
+        self._modified()
+
+    def set(self, section: str, option: str, value: typing.Optional[str] = None) -> None:
+        super().set(section, option, value)
+        self._modified()
+
+    def remove_option(self, section: str, option: str) -> bool:
+        existed = super().remove_option(section, option)
+        self._modified()
+        return existed
+
+    def remove_section(self, section: str) -> bool:
+        existed = super().remove_section(section)
+        if existed:
+            self._section_index.remove(section)
+        self._modified()
+        return existed
+
+    def _read(self, fp: typing.Iterable[str], fpname: str) -> None:
+        try:
+            if self._reader == "fast" and supports_fast_read(self):
+                read_fast(self, fp, fpname)
+            else:
+                super()._read(fp, fpname)  # type: ignore[misc]
+        finally:
+            self._section_index.invalidate()
+            self._modified()
+
+    def register_converter(self, typ: typing.Type[V], converter: typing.Callable[[str], V], inherit: bool = True) -> None:
+        """
+        Register a converter for a type, used wherever the type appears including inside
+        List, Tuple, Dict and Union. Without a converter, the type is called with the raw value.
+
+        Args:
+            typ (Type[V]): The type to convert values to.
+            converter (Callable[[str], V]): Function converting a raw value. Any exception raised by
+                the function is reported as ParseError with section and option.
+            inherit (bool, optional): Use the converter for subclasses of typ too. Defaults to True.
+
+        """
+        self.type_converters.register(typ, make_converter(typ, converter), inherit=inherit)
+        self._modified()
+
+    def register_generic_converter(
+        self,
+        origin: typing.Any,
+        converter: typing.Callable[[str, typing.List[typing.Any], CastFunction], typing.Any],
+    ) -> None:
+        """
+        Register a converter for a generic type, e.g. set for Set[int].
+
+        Args:
+            origin (Any): The origin of the generic type, as returned by typing.get_origin.
+            converter (Callable[[str, List[Any], CastFunction], Any]): Function converting a raw value,
+                called with the raw value, the type arguments and a function to cast an item to one of
+                the type arguments.
+
+        """
+
+        name = getattr(origin, "__name__", repr(origin))
+
+        def generic_converter(
+            section: str, option: str, value: str, args: typing.List[typing.Any], cast: CastFunction
+        ) -> typing.Any:
+            try:
+                return converter(value, args, cast)
+            except ParseError:
+                raise
+            except Exception:
+                raise ParseError(f"Cannot cast value '{value}' to '{name}'", section, option=option)
+
+        self.type_converters.register_generic(origin, generic_converter)
+        self._modified()
+
+    def read(  # type: ignore[override]
+        self,
+        filenames: typing.Union["StrOrBytesPath", typing.Iterable["StrOrBytesPath"]],
+        encoding: typing.Optional[str] = None,
+    ) -> typing.List[str]:
+        """
+        Read and parse a filename or an iterable of filenames.
+
+        Same as configparser.ConfigParser.read, but files compressed with gzip, bz2 or xz are
+        detected and decompressed in chunks while they are read.
+
+        Args:
+            filenames (Union[StrOrBytesPath, Iterable[StrOrBytesPath]]): The configuration files.
+                Files that cannot be opened are silently ignored.
+            encoding (Optional[str], optional): The encoding of the (decompressed) files. Defaults to None.
+
+        Returns:
+            List[str]: List of successfully read files.
+
+        Raises:
+            ParsingError: If a file cannot be read after it was opened, e.g. a truncated or corrupt
+                compressed file. See read_lines.
+
+        """
+        if isinstance(filenames, (str, bytes, os.PathLike)):
+            filenames = [filenames]
+        read_ok = []
+        for filename in filenames:
+            try:
+                fp = open_config_file(filename, encoding)
+            except OSError:
+                continue
+            with fp:
+                self._read(read_lines(fp, filename), filename)  # type: ignore[arg-type]
+            if isinstance(filename, os.PathLike):
+                filename = os.fspath(filename)
+            read_ok.append(filename)
+        return read_ok  # type: ignore[return-value]
+
+    def _resolve_type_hints(self, typ: typing.Any) -> typing.Dict[str, typing.Any]:
+        hints = self._type_hints.get(typ)
+        if hints is None:
+            hints = self._type_hints[typ] = resolve_type_hints(typ)
+        return hints
+
+    def _construction_plan(self, schema_class: typing.Any) -> ConstructionPlan:
+        plan = self._plans.get(schema_class)
+        if plan is None:
+            plan = self._plans[schema_class] = compile_construction_plan(schema_class)
+        return plan
+
+    def _type_converter(self, typ: typing.Any) -> Converter:
+        """
+        Get the converter of a type, called with section, option and raw value. Converters are built
+        only once per type, so repeated lookups don't walk the type again.
+
+        Args:
+            typ (Any): The type to convert values to.
+
+        Returns:
+            Converter: A function converting a raw value of any option to the given type.
+
+        """
+        try:
+            return self._typed_converters[typ]
+        except KeyError:
+            converter = self._typed_converters[typ] = functools.partial(
+                cast_value_wrapper, target_type=get_types(typ), registry=self.type_converters
+            )
+            return converter
+
+    def _get_converter(self, section: str, option: str, typ: typing.Any) -> typing.Callable[[str], typing.Any]:
+        """
+        Get the converter for an option of a given type, see _type_converter.
+
+        Args:
+            section (str): The name of the configuration section.
+            option (str): The name of the configuration option.
+            typ (Any): The type to convert the value to.
+
+        Returns:
+            Callable[[str], Any]: A function converting a raw value to the given type.
+
+        """
+        return functools.partial(self._type_converter(typ), section, option)
 
     def _get_type(self, section: str, option: str) -> typing.Any:
         """
@@ -293,8 +1186,8 @@ class ConfigParser(configparser.ConfigParser):
         config_class = self.__config_class_mapper__.get(section)
         if config_class:
             try:
-                typ = typing_extensions.get_type_hints(config_class)[option]
-                return lambda val: cast_value_wrapper(section, option, val, get_types(typ))
+                typ = self._resolve_type_hints(config_class)[option]
+                return self._get_converter(section, option, typ)
             except KeyError:
                 return str
             except Exception:  # pragma: no cover
@@ -319,120 +1212,465 @@ class ConfigParser(configparser.ConfigParser):
         value = super()._get_conv(section, option, conv)
         return value
 
-    def parse_section(
+    def get_typed(
         self,
-        using_dataclass: typing.Type[T],
-        section_name: typing.Union[str, None] = None,
-        extra: typing.Literal["allow", "ignore", "error"] = "allow",
-        init_vars: typing.Dict[str, typing.Any] = {},
-    ) -> T:
+        section: str,
+        option: str,
+        typ: typing.Type[V],
+        *,
+        raw: bool = False,
+        vars: typing.Optional[typing.Mapping[str, str]] = None,
+        fallback: typing.Any = configparser._UNSET,  # type: ignore[attr-defined]
+    ) -> V:
         """
-        Parse a configuration section into a dataclass instance.
+        Get the value of an option in a section converted to the given type.
+        The converter is built once per type and reused for subsequent calls.
 
         Args:
-            using_dataclass (Type[T]): The dataclass type to instantiate and populate.
-            section_name (Union[str, None], optional): The name of the configuration section.
-                If None, the name is derived from the dataclass name. Defaults to None.
-            extra (Literal["allow", "ignore", "error"], optional): How to handle extra fields
-                not present in the dataclass. "allow" allows extra fields, "ignore" ignores them,
-                and "error" raises an ParseError. Defaults to "allow".
-            init_vars (Dict[str, Any]): For any InitVars on dataclass, send values here as a dict
-                which will be send to dataclasses's init method and eventually to post_init method.
+            section (str): The name of the configuration section.
+            option (str): The name of the configuration option.
+            typ (Type[V]): The type to convert the value to. Supports the same types as parse_section.
+            raw (bool, optional): Disable interpolation. Defaults to False.
+            vars (Optional[Mapping[str, str]], optional): Additional values used for lookup and
+                interpolation. Defaults to None.
+            fallback (Any, optional): Value returned if the option is not found.
 
         Returns:
-            T: An instance of the specified dataclass populated with values from the configuration section.
+            V: The value of the option after type conversion.
 
         Raises:
-            ParseError: If parsing of configuration fails.
+            ParseError: If the value cannot be converted to the given type.
 
-        Note:
-            This method modifies the provided dataclass type by setting its __init__ method to an
-            empty function (_CUSTOM_INIT_METHOD) to avoid errors during instantiation.
+        """
+        conv = self._get_converter(section, option, drop_metadata(typ))
+        return self._get_conv(section, option, conv, raw=raw, vars=vars, fallback=fallback)  # type: ignore[no-any-return]
 
-            The function also sets the __repr__ and __str__ methods of the dataclass to custom methods
-            (_CUSTOM_REPR_METHOD and _CUSTOM_STR_METHOD) for better representation.
+    def typed_section(
+        self, using_dataclass: typing.Type[T], section_name: typing.Union[str, None] = None
+    ) -> "Section[T]":
+        """
+        Get a typed view of a configuration section. See Section for details.
+
+        Args:
+            using_dataclass (Type[T]): The dataclass describing the types of the options.
+            section_name (Union[str, None], optional): The name of the configuration section.
+                If None, the name is derived from the dataclass name. Defaults to None.
+
+        Returns:
+            Section[T]: A typed view of the configuration section.
+
+        Raises:
+            ParseError: If using_dataclass is not a dataclass.
+            NoSectionError: If the section is not found.
 
         """
         section_name_ = section_name or using_dataclass.__name__
         if not is_dataclass(using_dataclass):
             raise ParseError(f"{using_dataclass.__name__} is not a valid dataclass", section_name_)
+        if section_name_ != self.default_section and not self.has_section(section_name_):
+            raise configparser.NoSectionError(section_name_)
+        return Section(self, using_dataclass, section_name_)
+
+    def _check_schema_class(self, using_dataclass: typing.Type[C], section_name: str) -> None:
+        if is_namedtuple(using_dataclass):
+            return
+        if not is_dataclass(using_dataclass):
+            raise ParseError(f"{using_dataclass.__name__} is not a valid dataclass", section_name)
 
         if params := getattr(using_dataclass, "__dataclass_params__", None):
             if (init := getattr(params, "init", None)) is not None:
                 if init is False:
                     raise TypeError(f"init flag must be True for dataclass '{using_dataclass.__name__}'")
 
-        self.__config_class_mapper__[section_name_] = using_dataclass
-        # This are just "fields" and doesn't contain classvar or initvar fields
-        dataclass_fields = {item.name: item for item in dataclasses.fields(using_dataclass)}
-        initvar_fields = {
-            item.name: item
-            for item in using_dataclass.__dataclass_fields__.values()
-            if item._field_type is dataclasses._FIELD_INITVAR  # type: ignore [attr-defined]
-        }
-        options = []
-        # Adding all keys to args initially to maintain the order of position arguments
-        # to be sent to dataclass init method. It is not required for keyword arguments
-        args = {k: v for k, v in dataclass_fields.items() if not is_field_default(v)}
+    def _fill_slots(
+        self, plan: ConstructionPlan, section_name: str, extra: typing.Literal["allow", "ignore", "error"]
+    ) -> typing.Tuple[typing.List[typing.Any], typing.Dict[str, typing.Any], typing.Dict[str, typing.Any]]:
+        """
+        Convert the options of a section following a construction plan.
+
+        Returns:
+            Tuple[List[Any], Dict[str, Any], Dict[str, Any]]: The slots, the values of fields with a
+                default found in the section and the extra fields.
+
+        Raises:
+            ParseError: If a field without a default is missing or if extra fields are not allowed.
+
+        """
+        slots = list(plan.slots)
         kwargs = {}
         extra_fields = {}
-        seen = set()
-
-        # Iterate through config section to update args & kwargs
-        # for fields present in dataclass. Anything not found in
-        # dataclass is added to extra_fields
-        for key, _ in self.items(section_name_):
-            value = self._getitem(section_name_, key)
-            options.append(key)
-            if key in dataclass_fields:
-                field_info = dataclass_fields[key]
-                if is_field_default(field_info):
-                    kwargs[key] = value
-                else:
-                    args[key] = value
-                seen.add(key)
+
+        # Values returned by items are already interpolated, they are converted to the type of
+        # their field and put in its slot (or in kwargs for fields with a default).
+        # Anything not found in dataclass is added to extra_fields, options of fields which are not
+        # arguments of __init__ are ignored
+        for key, raw_value in self.items(section_name):
+            field = plan.fields.get(key)
+            if field is None:
+                if key in plan.not_init:
+                    continue
+                value: typing.Any = str(raw_value)
+            else:
+                value = self._type_converter(field[1])(section_name, key, raw_value)
+            if self.intern_pool is not None:
+                value = self.intern_pool.intern(value)
+            if field is None:
+                extra_fields[key] = value
+            elif field[0] < 0:
+                kwargs[key] = value
             else:
-                extra_fields[key] = generate_field(key, default=value)
+                slots[field[0]] = value
 
-        # Now iterate through dataclass fields and update default value of
-        # any "Optional" fields to None.
         # Any non-"Optional" fields present in dataclass but not found in
         # config options are missing fields and should raise error
-        missing_fields = []
-        for field, field_info in dataclass_fields.items():
-            field_type = typing_extensions.get_type_hints(using_dataclass)[field]
-            if not is_field_default(field_info) and field not in seen:
-                if is_field_optional(field_type):
-                    args[field] = None  # type: ignore
-                elif field not in options:
-                    missing_fields.append(field)
-
-        # Supply initvars as kwargs to the dataclass call
-        for field, field_info in initvar_fields.items():
-            if field in init_vars:
-                kwargs[field] = init_vars[field]
-            else:
-                kwargs[field] = None
-
+        missing_fields = [name for name, value in zip(plan.slot_names, slots) if value is dataclasses.MISSING]
         if len(missing_fields) > 0:
             raise ParseError(
                 "Unable to find value in section, default section or dataclass defaults",
-                section_name_,
+                section_name,
                 ", ".join(missing_fields),
             )
 
         if len(extra_fields) > 0 and extra == "error":
-            raise ParseError("Extra fields are not allowed in configuration.", section_name_)
+            raise ParseError("Extra fields are not allowed in configuration.", section_name)
+        return slots, kwargs, extra_fields
+
+    def parse_section(
+        self,
+        using_dataclass: typing.Type[C],
+        section_name: typing.Union[str, None] = None,
+        extra: typing.Literal["allow", "ignore", "error"] = "allow",
+        init_vars: typing.Dict[str, typing.Any] = {},
+    ) -> C:
+        """
+        Parse a configuration section into a dataclass instance.
+
+        Args:
+            using_dataclass (Type[C]): The dataclass type to instantiate and populate. A NamedTuple
+                class can be used as well.
+            section_name (Union[str, None], optional): The name of the configuration section.
+                If None, the name is derived from the dataclass name. Defaults to None.
+            extra (Literal["allow", "ignore", "error"], optional): How to handle extra fields
+                not present in the dataclass. "allow" allows extra fields, "ignore" ignores them,
+                and "error" raises an ParseError. Defaults to "allow". Extra fields are always
+                ignored for a NamedTuple unless extra is "error".
+            init_vars (Dict[str, Any]): For any InitVars on dataclass, send values here as a dict
+                which will be send to dataclasses's init method and eventually to post_init method.
+
+        Returns:
+            C: An instance of the specified dataclass populated with values from the configuration section.
+
+        Raises:
+            ParseError: If parsing of configuration fails, or if extra fields are allowed but the dataclass
+                is frozen or uses slots, so that they can't be stored on the instance.
 
-        section = using_dataclass(*args.values(), **kwargs)
+        Note:
+            Extra fields are set as attributes of the instance and their names are stored in its
+            __dataclass_extra_fields__ attribute, the dataclass itself is not modified except for its
+            __repr__ and __str__ methods, which are set once to custom methods (_CUSTOM_REPR_METHOD and
+            _CUSTOM_STR_METHOD) showing the extra fields as well.
+            Options of fields with init flag set to False are ignored, these fields are set by the
+            dataclass itself (their default or __post_init__).
+
+        """
+        section_name_ = section_name or using_dataclass.__name__
+        self._check_schema_class(using_dataclass, section_name_)
+        self.__config_class_mapper__[section_name_] = using_dataclass
+        # Either a dataclass or a NamedTuple
+        schema_class: typing.Any = using_dataclass
+        plan = self._construction_plan(schema_class)
+        slots, kwargs, extra_fields = self._fill_slots(plan, section_name_, extra)
+
+        # Supply initvars and keyword-only fields to the dataclass call
+        for field_name, index in plan.init_vars:
+            if index < 0:
+                kwargs[field_name] = init_vars.get(field_name)
+            else:
+                slots[index] = init_vars.get(field_name)
+        for index in range(plan.positional, len(slots)):
+            kwargs[plan.slot_names[index]] = slots[index]
+        if plan.positional < len(slots):
+            del slots[plan.positional :]
 
-        if extra_fields and extra == "allow":
-            for k, f in extra_fields.items():
-                setattr(section, k, f.default)
-            setattr(using_dataclass, "__dataclass_extra_fields__", extra_fields)
-            using_dataclass.__dataclass_fields__.update(extra_fields)
+        section = using_dataclass(*slots, **kwargs)
+
+        # Extra fields can't be stored in a NamedTuple and are ignored
+        if extra_fields and extra == "allow" and is_dataclass(schema_class):
+            if schema_class.__dataclass_params__.frozen or not hasattr(section, "__dict__"):
+                raise ParseError(
+                    f"Extra fields {', '.join(extra_fields)} can't be stored on an instance of frozen or slotted "
+                    f"dataclass '{schema_class.__name__}', use extra='ignore' to ignore them",
+                    section_name_,
+                )
+            for k, value in extra_fields.items():
+                setattr(section, k, value)
+            setattr(section, "__dataclass_extra_fields__", tuple(extra_fields))
             # Since __repr__ and __str__ are created when dataclass is created using @dataclass
-            # decorator, we need to rewrite our own methods for extra fields
-            using_dataclass.__repr__ = _CUSTOM_REPR_METHOD  # type: ignore[assignment]
-            using_dataclass.__str__ = _CUSTOM_STR_METHOD  # type: ignore[assignment]
+            # decorator, we need to rewrite our own methods for extra fields. They are only set once
+            # so the class is never modified while other threads use it.
+            if schema_class.__repr__ is not _CUSTOM_REPR_METHOD:
+                schema_class.__repr__ = _CUSTOM_REPR_METHOD
+                schema_class.__str__ = _CUSTOM_STR_METHOD
         return section
+
+    def sections_matching(self, pattern: str) -> typing.List[str]:
+        """
+        Get names of sections matching a shell-style pattern (see fnmatch), e.g. "service:*".
+        Section names are kept in a sorted index, so only sections sharing the literal prefix
+        of the pattern are looked at.
+
+        Args:
+            pattern (str): The section pattern.
+
+        Returns:
+            List[str]: The matching section names in sorted order. The default section is never included.
+
+        """
+        return self._section_index.match(pattern, self._sections)  # type: ignore[attr-defined]
+
+    def parse_matching(
+        self,
+        pattern: str,
+        using_dataclass: typing.Type[C],
+        extra: typing.Literal["allow", "ignore", "error"] = "allow",
+        init_vars: typing.Dict[str, typing.Any] = {},
+    ) -> typing.Dict[str, C]:
+        """
+        Parse all configuration sections matching a shell-style pattern into dataclass instances.
+
+        Args:
+            pattern (str): The section pattern, e.g. "service:*". See sections_matching.
+            using_dataclass (Type[T]): The dataclass type to instantiate and populate.
+            extra (Literal["allow", "ignore", "error"], optional): How to handle extra fields. See parse_section.
+            init_vars (Dict[str, Any]): Values for InitVars on dataclass. See parse_section.
+
+        Returns:
+            Dict[str, C]: A mapping of section names to dataclass instances.
+
+        Raises:
+            ParseError: If parsing of any configuration section fails.
+
+        """
+        return {
+            section_name: self.parse_section(using_dataclass, section_name, extra=extra, init_vars=init_vars)
+            for section_name in self.sections_matching(pattern)
+        }
+
+    def parse_records(
+        self,
+        pattern: str,
+        using_dataclass: typing.Type[C],
+        extra: typing.Literal["allow", "ignore", "error"] = "allow",
+    ) -> Records:
+        """
+        Parse all configuration sections matching a shell-style pattern into tuples of field values,
+        without creating an instance per section. Values are converted and checked exactly as by
+        parse_section, and the fields are those which can be given to the dataclass (or NamedTuple).
+
+        Unlike parse_section, __post_init__ is not called and extra fields are ignored unless extra
+        is "error".
+
+        Args:
+            pattern (str): The section pattern, e.g. "service:*". See sections_matching.
+            using_dataclass (Type[C]): The dataclass (or NamedTuple) type describing the fields.
+            extra (Literal["allow", "ignore", "error"], optional): How to handle extra fields. See parse_section.
+
+        Returns:
+            Records: The section names and a tuple of field values per section.
+
+        Raises:
+            ParseError: If parsing of any configuration section fails.
+
+        """
+        self._check_schema_class(using_dataclass, pattern)
+        plan = self._construction_plan(using_dataclass)
+        sections = self.sections_matching(pattern)
+        rows = []
+        for section_name in sections:
+            self.__config_class_mapper__[section_name] = using_dataclass
+            slots, kwargs, _ = self._fill_slots(plan, section_name, extra)
+            rows.append(
+                tuple(
+                    slots[index] if index >= 0 else kwargs[name] if name in kwargs else default()  # type: ignore[misc]
+                    for name, index, default in plan.record_fields
+                )
+            )
+        fields = types.MappingProxyType({name: i for i, (name, _, _) in enumerate(plan.record_fields)})
+        return Records(fields, sections, rows)
+
+    def write_section(self, instance: "DataclassInstance", section_name: typing.Union[str, None] = None) -> None:
+        """
+        Write a dataclass instance to a configuration section. This is the inverse of parse_section.
+
+        Args:
+            instance (DataclassInstance): The dataclass instance to write.
+            section_name (Union[str, None], optional): The name of the configuration section.
+                If None, the name is derived from the dataclass name. Defaults to None.
+
+        Raises:
+            ParseError: If instance is not a dataclass instance, or if a value can't be written so that it
+                reads back unchanged (see _format_section).
+
+        Note:
+            Existing options of the section which are not fields of the dataclass are left untouched.
+            "%" (or "$" with ExtendedInterpolation) is escaped so that values read back unchanged.
+
+        """
+        section_name_ = section_name or type(instance).__name__
+        if not is_dataclass(type(instance)):
+            raise ParseError(f"{type(instance).__name__} is not a valid dataclass", section_name_)
+
+        options = self._format_section(section_name_, instance)
+        if section_name_ != self.default_section and not self.has_section(section_name_):
+            self.add_section(section_name_)
+        for option, value in options:
+            self.set(section_name_, option, self._escape_interpolation(value))
+
+    def _format_section(self, section_name: str, instance: "DataclassInstance") -> typing.List[typing.Tuple[str, str]]:
+        """
+        Format a dataclass instance with format_section, checking that every field reads back unchanged.
+
+        Raises:
+            ParseError: If a value can't be represented, e.g. a list item containing ", " or a string
+                with surrounding whitespace, which would be split or stripped when read.
+
+        """
+        type_hints = self._resolve_type_hints(type(instance))
+        options = format_section(instance)
+        for option, text in options:
+            value = getattr(instance, option)
+            # Extra fields have no type, and values without equality (other than identity) can't be compared
+            if option not in type_hints or type(value).__eq__ is object.__eq__:  # type: ignore[comparison-overlap]
+                continue
+            # What the parser reads from the written file: lines are stripped, trailing empty lines dropped
+            read_back = "\n".join(line.strip() for line in text.split("\n")).rstrip()
+            try:
+                result = self._type_converter(type_hints[option])(section_name, option, read_back)
+                same = bool(result == value) or (result != result and value != value)
+            except ParseError:
+                same = False
+            if not same:
+                raise ParseError(
+                    f"Value {value!r} cannot be written as it would not be read back unchanged",
+                    section_name,
+                    option=option,
+                )
+        return options
+
+    def _escape_interpolation(self, value: str) -> str:
+        # Formatted values are literal, so the interpolation syntax must read back as the character itself
+        interpolation = self._interpolation  # type: ignore[attr-defined]
+        if isinstance(interpolation, configparser.BasicInterpolation):
+            return value.replace("%", "%%")
+        if isinstance(interpolation, configparser.ExtendedInterpolation):
+            return value.replace("$", "$$")
+        return value
+
+    def dump_all(
+        self,
+        sections: typing.Union[typing.Mapping[str, "DataclassInstance"], typing.Iterable["DataclassInstance"]],
+        fp: typing.TextIO,
+        space_around_delimiters: bool = True,
+    ) -> None:
+        """
+        Write dataclass instances to a file object in INI format, one section per instance.
+        Sections are streamed to the file object one at a time without being stored in the parser.
+
+        Args:
+            sections (Union[Mapping[str, DataclassInstance], Iterable[DataclassInstance]]): Either a mapping of
+                section names to dataclass instances or an iterable of dataclass instances. For an iterable,
+                the section name is derived from the dataclass name.
+            fp (TextIO): The file object to write to.
+            space_around_delimiters (bool, optional): Whether to surround the delimiter with spaces.
+                Defaults to True.
+
+        Raises:
+            ParseError: If any of the instances is not a dataclass instance, or if a value can't be written so
+                that it reads back unchanged (see _format_section).
+
+        """
+        if isinstance(sections, typing.Mapping):
+            items: typing.Iterable[typing.Tuple[str, "DataclassInstance"]] = sections.items()
+        else:
+            items = ((type(instance).__name__, instance) for instance in sections)
+
+        delimiter = self._delimiters[0]  # type: ignore[attr-defined]
+        if space_around_delimiters:
+            delimiter = f" {delimiter} "
+
+        for section_name, instance in items:
+            if not is_dataclass(type(instance)):
+                raise ParseError(f"{type(instance).__name__} is not a valid dataclass", section_name)
+            lines = [f"[{section_name}]\n"]
+            for option, value in self._format_section(section_name, instance):
+                value = self._escape_interpolation(value)
+                value = self._interpolation.before_write(self, section_name, option, value)  # type: ignore[attr-defined]
+                value = value.replace("\n", "\n\t")
+                lines.append(f"{option}{delimiter}{value}\n")
+            lines.append("\n")
+            fp.write("".join(lines))
+
+    def diff(self, other: configparser.RawConfigParser) -> ConfigDiff:
+        """
+        Compare this configuration with another (typically newly read) configuration.
+        Only raw values are compared, so nothing is converted and no dataclass is required.
+
+        Args:
+            other (RawConfigParser): The new configuration state.
+
+        Returns:
+            ConfigDiff: Sections and options added, removed or changed in other.
+
+        """
+        return diff_configs(self, other)
+
+
+class Section(typing.Mapping[str, typing.Any], typing.Generic[T]):
+    """
+    Typed read only view of a configuration section.
+
+    Converters for all fields of the dataclass are built once when the view is created and
+    converted values are memoized until the configuration is modified (set, remove, read etc.).
+    Options which are not fields of the dataclass are returned as string.
+
+    Attributes:
+        parser (ConfigParser): The parser the section belongs to.
+        name (str): The name of the configuration section.
+        using_dataclass (Type[T]): The dataclass describing the types of the options.
+
+    """
+
+    def __init__(self, parser: ConfigParser, using_dataclass: typing.Type[T], section_name: str) -> None:
+        self.parser = parser
+        self.name = section_name
+        self.using_dataclass = using_dataclass
+        type_hints = parser._resolve_type_hints(using_dataclass)
+        self._converters = {
+            field.name: parser._get_converter(section_name, field.name, type_hints[field.name])
+            for field in dataclasses.fields(using_dataclass)
+        }
+        self._values: typing.Dict[str, typing.Any] = {}
+        self._version = parser._version
+
+    def __getitem__(self, option: str) -> typing.Any:
+        if self._version != self.parser._version:
+            self._values = {}
+            self._version = self.parser._version
+        try:
+            return self._values[option]
+        except KeyError:
+            pass
+        if not self.parser.has_option(self.name, option):
+            raise KeyError(option)
+        value = self.parser._get_conv(self.name, option, self._converters.get(option, str))
+        self._values[option] = value
+        return value
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self.parser.options(self.name))
+
+    def __len__(self) -> int:
+        return len(self.parser.options(self.name))
+
+    def __repr__(self) -> str:
+        return f"<Section: {self.name}>"
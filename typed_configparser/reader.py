@@ -0,0 +1,325 @@
+import configparser
+import importlib
+import io
+import re
+import sys
+import typing
+
+if typing.TYPE_CHECKING:
+    from _typeshed import StrOrBytesPath
+
+_RAW_ = configparser.RawConfigParser
+_NONSPACE_PATTERN_ = r"\S"
+# Before Python 3.10 a section header ends at the first "]" of the line, since then at the last one
+_HEADER_ENDS_AT_FIRST_BRACKET_ = "[^]]" in _RAW_._SECT_TMPL
+
+# Magic numbers of compressed files and the standard library modules which decompress them
+_COMPRESSION_MAGIC_ = ((b"\x1f\x8b", "gzip"), (b"BZh", "bz2"), (b"\xfd7zXZ\x00", "lzma"))
+
+
+# Decompressing file objects reading from an open binary file object (which they don't close)
+_DECOMPRESSORS_: typing.Dict[str, typing.Callable[[typing.Any, typing.BinaryIO], typing.BinaryIO]] = {
+    "gzip": lambda module, fp: module.GzipFile(fileobj=fp, mode="rb"),
+    "bz2": lambda module, fp: module.BZ2File(fp, "rb"),
+    "lzma": lambda module, fp: module.LZMAFile(fp, "rb"),
+}
+
+
+class _TextFile(io.TextIOWrapper):
+    """Text file object over a (decompressing) binary file object, closing the opened file as well"""
+
+    def __init__(self, buffer: typing.BinaryIO, file: typing.BinaryIO, encoding: typing.Optional[str]) -> None:
+        super().__init__(buffer, encoding=encoding)
+        self._file = file
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._file.close()
+
+
+def open_config_file(filename: "StrOrBytesPath", encoding: typing.Optional[str] = None) -> typing.TextIO:
+    """
+    Open a configuration file for reading as text. Files compressed with gzip, bz2 or xz are detected
+    from their content and decompressed in chunks while they are read, so the decompressed file is
+    never held in memory as a whole.
+
+    Args:
+        filename (StrOrBytesPath): The configuration file.
+        encoding (Optional[str], optional): The encoding of the (decompressed) file. Defaults to None.
+
+    Returns:
+        TextIO: The file object, to be closed by the caller.
+
+    Raises:
+        OSError: If the file cannot be opened.
+        ImportError: If the file is compressed and Python is built without support for the compression.
+
+    """
+    if sys.version_info >= (3, 10):  # pragma: no cover
+        encoding = io.text_encoding(encoding)
+    # The file is opened once and its header peeked from the buffer, so that pipes can be read too
+    fp = open(filename, "rb")
+    try:
+        head = fp.peek(6)[:6]
+        for magic, module_name in _COMPRESSION_MAGIC_:
+            if head.startswith(magic):
+                module = importlib.import_module(module_name)
+                return _TextFile(_DECOMPRESSORS_[module_name](module, fp), fp, encoding)
+        return _TextFile(fp, fp, encoding)
+    except BaseException:
+        fp.close()
+        raise
+
+
+def _decompression_errors() -> typing.Tuple[typing.Type[BaseException], ...]:
+    # Errors of truncated or corrupt compressed files. The modules are only imported (by gzip, lzma)
+    # when a compressed file is opened.
+    errors: typing.List[typing.Type[BaseException]] = [OSError, EOFError]
+    for module_name, name in (("zlib", "error"), ("lzma", "LZMAError")):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            errors.append(getattr(module, name))
+    return tuple(errors)
+
+
+def read_lines(fp: typing.Iterable[str], fpname: str) -> typing.Iterator[str]:
+    """
+    Iterate over the lines of a configuration file opened with open_config_file. Errors raised while
+    reading, e.g. by a truncated or corrupt compressed file, are raised as ParsingError. As for other
+    parsing errors, what was read before the error is kept by the parser.
+
+    Args:
+        fp (Iterable[str]): The file object.
+        fpname (str): The name of the configuration file, used in errors.
+
+    Raises:
+        ParsingError: If the file cannot be read or decompressed.
+
+    """
+    lineno = 0
+    try:
+        for lineno, line in enumerate(fp, start=1):
+            yield line
+    except _decompression_errors() as e:
+        error = configparser.ParsingError(fpname)
+        error.append(lineno + 1, f"{type(e).__name__}: {e}")
+        raise error from e
+
+
+def supports_fast_read(parser: configparser.RawConfigParser) -> bool:
+    """
+    Check whether read_fast produces the same result as the standard library reader for a parser.
+    This is the case unless the parser customizes the regular expressions used for reading or
+    uses delimiters containing whitespace. read_fast follows the reader of Python 3.8 to 3.12, the
+    reader of Python 3.13 (which handles comments and continuation lines differently) is not
+    supported.
+
+    Args:
+        parser (RawConfigParser): The parser to check.
+
+    Returns:
+        bool: True if the parser can be read using read_fast.
+
+    """
+    if not hasattr(parser, "_comment_prefixes") or not hasattr(parser, "_inline_comment_prefixes"):
+        return False
+    delimiters: typing.Tuple[str, ...] = parser._delimiters  # type: ignore[attr-defined]
+    if not delimiters or any(not d or any(c.isspace() for c in d) for d in delimiters):
+        return False
+    if getattr(parser, "_allow_unnamed_section", False):  # pragma: no cover
+        return False
+
+    delim = "|".join(re.escape(d) for d in delimiters)
+    template = _RAW_._OPT_NV_TMPL if parser._allow_no_value else _RAW_._OPT_TMPL  # type: ignore[attr-defined]
+    return bool(
+        parser.SECTCRE.pattern == _RAW_._SECT_TMPL
+        and parser._optcre.pattern == template.format(delim=delim)  # type: ignore[attr-defined]
+        and parser.NONSPACECRE.pattern == _NONSPACE_PATTERN_
+    )
+
+
+def _error(
+    error: typing.Optional[configparser.ParsingError], fpname: str, lineno: int, line: str
+) -> configparser.ParsingError:
+    if error is None:
+        error = configparser.ParsingError(fpname)
+    error.append(lineno, repr(line))
+    return error
+
+
+def _split_option(
+    value: str, delimiters: typing.Tuple[str, ...], allow_no_value: bool
+) -> typing.Optional[typing.Tuple[str, typing.Optional[str]]]:
+    """
+    Split an option line at the first delimiter, equivalent to matching OPTCRE (or OPTCRE_NV).
+
+    Returns:
+        Optional[Tuple[str, Optional[str]]]: Option name and value, or None if the line is not an option.
+
+    """
+    index = -1
+    length = 0
+    for delimiter in delimiters:
+        i = value.find(delimiter)
+        if i > -1 and (index == -1 or i < index):
+            index = i
+            length = len(delimiter)
+    if index == -1:
+        if allow_no_value:
+            return value, None
+        return None
+    return value[:index], value[index + length :]
+
+
+def _append(section: typing.Dict[str, typing.Any], option: str, value: str) -> None:
+    current = section[option]
+    if type(current) is str:
+        section[option] = [current, value]
+    else:
+        current.append(value)
+
+
+def read_fast(parser: configparser.RawConfigParser, fp: typing.Iterable[str], fpname: str) -> None:
+    """
+    Parse a sectioned configuration file into the internal structures of a parser in a single pass.
+
+    This is a drop-in replacement for RawConfigParser._read which follows the same rules for
+    section headers, options, delimiters, comments, continuation lines, empty lines and duplicate
+    checks, and raises the same errors. It avoids running several regular expressions and building
+    intermediate structures for every line, using string methods instead.
+    The parser must be supported, see supports_fast_read.
+
+    Args:
+        parser (RawConfigParser): The parser to read into.
+        fp (Iterable[str]): Lines of the configuration file.
+        fpname (str): The name of the configuration file, used in errors.
+
+    Raises:
+        MissingSectionHeaderError: If the file doesn't start with a section header.
+        DuplicateSectionError: If a section is found twice and the parser is strict.
+        DuplicateOptionError: If an option is found twice in a section and the parser is strict.
+        ParsingError: If any line can't be parsed, raised after reading the whole file.
+
+    """
+    sections: typing.Dict[str, typing.Any] = parser._sections  # type: ignore[attr-defined]
+    defaults: typing.Dict[str, typing.Any] = parser._defaults  # type: ignore[attr-defined]
+    proxies: typing.Dict[str, configparser.SectionProxy] = parser._proxies  # type: ignore[attr-defined]
+    new_section: typing.Callable[[], typing.Dict[str, typing.Any]] = parser._dict  # type: ignore[attr-defined]
+    delimiters: typing.Tuple[str, ...] = parser._delimiters  # type: ignore[attr-defined]
+    comment_prefixes: typing.Tuple[str, ...] = parser._comment_prefixes  # type: ignore[attr-defined]
+    inline_comment_prefixes: typing.Tuple[str, ...] = parser._inline_comment_prefixes  # type: ignore[attr-defined]
+    strict: bool = parser._strict  # type: ignore[attr-defined]
+    allow_no_value: bool = parser._allow_no_value  # type: ignore[attr-defined]
+    empty_lines_in_values: bool = parser._empty_lines_in_values  # type: ignore[attr-defined]
+    default_section = parser.default_section
+    optionxform = parser.optionxform
+    optcre: typing.Pattern[str] = parser._optcre  # type: ignore[attr-defined]
+
+    elements_added: typing.Set[typing.Union[str, typing.Tuple[typing.Optional[str], str]]] = set()
+    cursect: typing.Optional[typing.Dict[str, typing.Any]] = None
+    sectname: typing.Optional[str] = None
+    optname: typing.Optional[str] = None
+    indent_level = 0
+    e: typing.Optional[configparser.ParsingError] = None
+
+    for lineno, line in enumerate(fp, start=1):
+        comment_start: typing.Optional[int] = None
+        if inline_comment_prefixes:
+            # Same lookup as the standard library, including the order in which
+            # occurrences of different prefixes are looked at
+            start = sys.maxsize
+            inline_prefixes = {p: -1 for p in inline_comment_prefixes}
+            while start == sys.maxsize and inline_prefixes:
+                next_prefixes = {}
+                for prefix, index in inline_prefixes.items():
+                    index = line.find(prefix, index + 1)
+                    if index == -1:
+                        continue
+                    next_prefixes[prefix] = index
+                    if index == 0 or (index > 0 and line[index - 1].isspace()):
+                        start = min(start, index)
+                inline_prefixes = next_prefixes
+            if start != sys.maxsize:
+                comment_start = start
+
+        value = line.strip()
+        if comment_prefixes and value.startswith(comment_prefixes):
+            comment_start = 0
+        if comment_start is not None:
+            value = line[:comment_start].strip()
+
+        if not value:
+            if empty_lines_in_values:
+                # add empty line to the value, but only if there was no comment on the line
+                if comment_start is None and cursect is not None and optname and cursect[optname] is not None:
+                    _append(cursect, optname, "")  # newlines added at join
+            else:
+                # empty line marks end of value
+                indent_level = sys.maxsize
+            continue
+
+        # value starts with the first non whitespace character of the line
+        cur_indent_level = line.find(value[0])
+        if cursect is not None and optname and cur_indent_level > indent_level:
+            _append(cursect, optname, value)
+            continue
+
+        indent_level = cur_indent_level
+        # Lines with embedded newlines can only come from custom iterables, these are matched
+        # with the regular expressions since "." does not match a newline
+        multiline = "\n" in value
+        if multiline:  # pragma: no cover
+            mo = parser.SECTCRE.match(value)
+            header = mo.group("header") if mo else None
+        else:
+            if value[0] != "[":
+                end = -1
+            elif _HEADER_ENDS_AT_FIRST_BRACKET_:
+                end = value.find("]")
+            else:
+                end = value.rfind("]")
+            header = value[1:end] if end >= 2 else None
+        if header is not None:
+            sectname = header
+            if sectname in sections:
+                if strict and sectname in elements_added:
+                    raise configparser.DuplicateSectionError(sectname, fpname, lineno)
+                cursect = sections[sectname]
+                elements_added.add(sectname)
+            elif sectname == default_section:
+                cursect = defaults
+            else:
+                cursect = new_section()
+                sections[sectname] = cursect
+                proxies[sectname] = configparser.SectionProxy(parser, sectname)
+                elements_added.add(sectname)
+            # So sections can't start with a continuation line
+            optname = None
+        elif cursect is None:
+            raise configparser.MissingSectionHeaderError(fpname, lineno, line)
+        else:
+            if multiline:  # pragma: no cover
+                mo = optcre.match(value)
+                option = mo.group("option", "value") if mo else None
+            else:
+                option = _split_option(value, delimiters, allow_no_value)
+            if option is None:
+                # a non-fatal parsing error, raised at the end of the file with all bogus lines
+                e = _error(e, fpname, lineno, line)
+                continue
+            optname, optval = option
+            if not optname:
+                e = _error(e, fpname, lineno, line)
+            optname = optionxform(optname.rstrip())
+            if strict and (sectname, optname) in elements_added:
+                raise configparser.DuplicateOptionError(sectname or "", optname, fpname, lineno)
+            elements_added.add((sectname, optname))
+            # Single line values are stored as string, which is what joining a list with
+            # the single value gives. Lists are only created for multiline values.
+            cursect[optname] = optval.strip() if optval is not None else None
+
+    parser._join_multiline_values()  # type: ignore[attr-defined]
+    if e:
+        raise e
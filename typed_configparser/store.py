@@ -0,0 +1,221 @@
+import collections
+import dataclasses
+import os
+import threading
+import time
+import typing
+
+from typed_configparser.generations import Generation, Schema, load_generation
+from typed_configparser.memory import approximate_size
+from typed_configparser.parser import ConfigParser
+
+
+@dataclasses.dataclass(frozen=True)
+class StoreStats:
+    """
+    Statistics of a ConfigStore.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups which had to wait for a load, including lookups joining a load in progress.
+        loads (int): Configurations read and parsed.
+        evictions (int): Configurations evicted to stay within the limits.
+        entries (int): Configurations currently cached.
+        bytes (int): Approximate memory of the cached configurations.
+
+    """
+
+    hits: int
+    misses: int
+    loads: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+@dataclasses.dataclass
+class _Entry:
+    generation: Generation
+    mtime_ns: int
+    size: int
+    checked: float
+
+
+class _Load:
+    """A load in progress, which other threads asking for the same tenant wait for"""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.generation: typing.Optional[Generation] = None
+        self.error: typing.Optional[BaseException] = None
+
+
+class ConfigStore:
+    """
+    Bounded cache of the parsed configurations of many tenants, each with its own file.
+
+    A tenant's configuration is read and parsed on first use (see load_generation) and kept until it
+    is evicted, least recently used first, to stay within max_entries and max_bytes. The file is
+    revalidated by its modification time and reloaded when it changed. Concurrent lookups of a
+    tenant which is being loaded wait for that load instead of loading the file again.
+
+    Example:
+        store = ConfigStore("tenants/{tenant}.ini", {"database": Database}, max_entries=1000)
+        store.get("acme")["database"].host
+
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, typing.Callable[[str], str]],
+        schema: Schema,
+        max_entries: typing.Optional[int] = 1024,
+        max_bytes: typing.Optional[int] = None,
+        check_interval: float = 0.0,
+        extra: typing.Literal["ignore", "ignore", "error"] = "ignore",
+        parser_factory: typing.Callable[[], ConfigParser] = ConfigParser,
+    ) -> None:
+        """
+        Initialize an empty store.
+
+        Args:
+            path (Union[str, Callable[[str], str]]): The file of a tenant, either a template formatted
+                with the tenant e.g. "tenants/{tenant}.ini" or a function called with the tenant.
+            schema (Schema): Section names or patterns, and the dataclass to parse matching sections into.
+            max_entries (Optional[int], optional): Maximum number of cached configurations, None for no
+                limit. Defaults to 1024.
+            max_bytes (Optional[int], optional): Maximum approximate memory of cached configurations,
+                None for no limit. The most recently used configuration is always kept. Defaults to None.
+            check_interval (float, optional): Seconds during which a cached configuration is used without
+                checking the modification time of its file. Defaults to 0, checking on every lookup.
+            extra (Literal["allow", "ignore", "error"], optional): How to handle extra fields, see parse_section.
+                Extra fields can't be stored on frozen (or slotted) dataclasses. Defaults to "ignore".
+            parser_factory (Callable[[], ConfigParser], optional): Creates the parser of every load.
+                Defaults to ConfigParser.
+
+        """
+        self.path: typing.Callable[[str], str] = (
+            (lambda tenant: path.format(tenant=tenant)) if isinstance(path, str) else path
+        )
+        self.schema = dict(schema)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.check_interval = check_interval
+        self.extra = extra
+        self.parser_factory = parser_factory
+        self._entries: "collections.OrderedDict[str, _Entry]" = collections.OrderedDict()
+        self._loads: typing.Dict[str, _Load] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._loads_count = 0
+        self._evictions = 0
+
+    def get(self, tenant: str) -> Generation:
+        """
+        Get the configuration of a tenant, loading it if it is not cached or its file changed.
+
+        Args:
+            tenant (str): The tenant.
+
+        Returns:
+            Generation: The parsed configuration of the tenant.
+
+        Raises:
+            OSError: If the file of the tenant cannot be accessed.
+            NoSectionError: If a section of the schema is not found.
+            ParseError: If parsing of a section fails.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(tenant)
+            if entry is not None and now - entry.checked < self.check_interval:
+                self._entries.move_to_end(tenant)
+                self._hits += 1
+                return entry.generation
+
+        filename = self.path(tenant)
+        mtime_ns = os.stat(filename).st_mtime_ns
+        with self._lock:
+            entry = self._entries.get(tenant)
+            if entry is not None and entry.mtime_ns == mtime_ns:
+                entry.checked = now
+                self._entries.move_to_end(tenant)
+                self._hits += 1
+                return entry.generation
+            self._misses += 1
+            load = self._loads.get(tenant)
+            leader = load is None
+            if load is None:
+                load = self._loads[tenant] = _Load()
+            number = entry.generation.number + 1 if entry is not None else 1
+
+        if not leader:
+            load.done.wait()
+            if load.error is not None:
+                raise load.error
+            return load.generation  # type: ignore[return-value]
+
+        try:
+            generation = load_generation(number, filename, self.schema, self.extra, self.parser_factory)
+            size = approximate_size(generation)
+        except BaseException as e:
+            load.error = e
+            with self._lock:
+                del self._loads[tenant]
+            load.done.set()
+            raise
+
+        with self._lock:
+            self._loads_count += 1
+            old = self._entries.pop(tenant, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[tenant] = _Entry(generation, mtime_ns, size, now)
+            self._bytes += size
+            self._evict()
+            del self._loads[tenant]
+        load.generation = generation
+        load.done.set()
+        return generation
+
+    def _evict(self) -> None:
+        while len(self._entries) > 1 and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._evictions += 1
+
+    def invalidate(self, tenant: str) -> None:
+        """Remove the configuration of a tenant from the cache, it is loaded again on next use"""
+        with self._lock:
+            entry = self._entries.pop(tenant, None)
+            if entry is not None:
+                self._bytes -= entry.size
+
+    def tenants(self) -> typing.List[str]:
+        """Get the cached tenants, least recently used first"""
+        with self._lock:
+            return list(self._entries)
+
+    def __contains__(self, tenant: object) -> bool:
+        return tenant in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> StoreStats:
+        """Get a snapshot of the statistics of the store"""
+        with self._lock:
+            return StoreStats(
+                hits=self._hits,
+                misses=self._misses,
+                loads=self._loads_count,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )